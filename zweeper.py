@@ -1,11 +1,13 @@
 #! ./venv/bin/python
 
-import sys, os
+import sys, os, time, multiprocessing
 from PySide6 import QtCore, QtWidgets, QtGui
 from PySide6.QtWidgets import QMessageBox, QApplication
 from PySide6.QtGui import QFontDatabase, QScreen
 
 from zweeper_engine import Minefield
+from zweeper_generator import NoGuessGenerator
+from zweeper_cache import BoardCache
 
 
 
@@ -17,11 +19,14 @@ options = {
 	"mines": 40,
 	"autoMode": True,
 	"noGuessMode": True,
+	"safeZone": 1,
 
 	"seed": None,
+	"pregenerationTimeout": 30,
 
 	"windowToScreenSizeRatio": 0.8,
 	"cellSizeInterval": (20, 40),
+	"frameInterval": 16,
 }
 
 
@@ -40,6 +45,27 @@ def showMessageBox(title, text):
 	msg.setText(text)
 	msg.exec()
 
+def drawBevel(painter: QtGui.QPainter, rect: QtCore.QRect, topleft, bottomright):
+	# the two borders meet on the diagonals, like css borders
+	(topleft_width, topleft_color), (bottomright_width, bottomright_color) = topleft, bottomright
+	x, y, w, h = rect.x(), rect.y(), rect.width(), rect.height()
+
+	painter.setPen(QtCore.Qt.NoPen)
+
+	if (topleft_width > 0):
+		painter.setBrush(QtGui.QColor(topleft_color))
+		painter.drawPolygon(QtGui.QPolygonF([QtCore.QPointF(*point) for point in (
+			(x, y), (x+w, y), (x+w-bottomright_width, y+topleft_width),
+			(x+topleft_width, y+topleft_width), (x+topleft_width, y+h-bottomright_width), (x, y+h)
+		)]))
+
+	if (bottomright_width > 0):
+		painter.setBrush(QtGui.QColor(bottomright_color))
+		painter.drawPolygon(QtGui.QPolygonF([QtCore.QPointF(*point) for point in (
+			(x+w, y), (x+w, y+h), (x, y+h),
+			(x+topleft_width, y+h-bottomright_width), (x+w-bottomright_width, y+h-bottomright_width), (x+w-bottomright_width, y+topleft_width)
+		)]))
+
 
 
 class zweeper(QtWidgets.QWidget):
@@ -50,7 +76,14 @@ class zweeper(QtWidgets.QWidget):
 		self.show()
 
 	def initUI(self):
-		self.minefield = Minefield(options["rows"], options["cols"], options["mines"], seed=options["seed"])
+		self.minefield = Minefield(options["rows"], options["cols"], options["mines"], seed=options["seed"], lazy=True, safeZone=options["safeZone"])
+		self.generator = NoGuessGenerator(options["rows"], options["cols"], options["mines"], repair=True)
+		self.pregenerator = NoGuessGenerator(options["rows"], options["cols"], options["mines"], processes=2, repair=True)
+
+		try:
+			self.boardCache = BoardCache()
+		except Exception:
+			self.boardCache = None
 
 		max_window_width  = QScreen.availableGeometry(QApplication.primaryScreen()).width()  * options["windowToScreenSizeRatio"]
 		max_window_height = QScreen.availableGeometry(QApplication.primaryScreen()).height() * options["windowToScreenSizeRatio"]
@@ -59,176 +92,249 @@ class zweeper(QtWidgets.QWidget):
 		self.cell_size = minmax(self.cell_size, *options["cellSizeInterval"])
 
 		self.setFixedSize(self.cell_size*self.minefield.cols, self.cell_size*self.minefield.rows)
+		self.setMouseTracking(True)
 		self.updateTitle()
 
-		self.layout = QtWidgets.QGridLayout()
-		self.layout.setSpacing(0)
-		self.layout.setContentsMargins(0, 0, 0, 0)
-
 		centerWindow(self)
 
-		for row in range(self.minefield.rows):
-			for col in range(self.minefield.cols):
-				cell = QtWidgets.QLabel()
-				cell.setMinimumSize(20, 20)
-				cell.setAlignment(QtCore.Qt.AlignCenter)
-				cell.setFixedSize(self.cell_size, self.cell_size)
+		id = QFontDatabase.addApplicationFont(os.path.join(WORKING_DIR, "minesweeper.otf"))
+		families = QFontDatabase.applicationFontFamilies(id)
+		self.minesweeperFontID = families[0]
 
-				cell.mousePressEvent = lambda event, row=row, col=col: self.cellPress(event, row, col)
-				cell.mouseReleaseEvent = lambda event, row=row, col=col: self.cellRelease(event, row, col)
+		self.lastMousePos = (-1, -1)
+		self.grabbedPos = None
+		self.highlighted_cells = []
+		self.pressed_cells = set()
 
-				cell.setMouseTracking(True)
-				cell.mouseMoveEvent = lambda event, row=row, col=col: self.cellMouseMove(event, row, col)
+		self.cellVisuals = [None]*(self.minefield.rows*self.minefield.cols)
+		self.cellPixmaps = {}
+		self.cellPixmapsKey = None
 
-				self.layout.addWidget(cell, row, col)
+		self.dirtyAll = False
+		self.dirtyCells = set()
 
-		self.setLayout(self.layout)
+		self.frameTimer = QtCore.QTimer(self)
+		self.frameTimer.setSingleShot(True)
+		self.frameTimer.setInterval(options["frameInterval"])
+		self.frameTimer.timeout.connect(self.drawFrame)
 
-		id = QFontDatabase.addApplicationFont(os.path.join(WORKING_DIR, "minesweeper.otf"))
-		families = QFontDatabase.applicationFontFamilies(id)
-		self.minesweeperFontID = families[0]
+		self.generation = None
+		self.pregeneration = None
+		self.nextBoard = None
 
-		self.lastMousePos = (-1, -1)
+		self.progressTimer = QtCore.QTimer(self)
+		self.progressTimer.setInterval(100)
+		self.progressTimer.timeout.connect(self.updateProgress)
 
 		self.updateUI(True)
+		self.pregenerate()
 
 
 
-	def updateUI(self, all=False, zone=[], pressed=[], highlight=[]):
-		scale = (min(self.width()/self.minefield.cols, self.height()/self.minefield.rows))/30
-		game_lost = self.minefield.isLost()
+	def updateUI(self, all=False, zone=None, pressed=None, highlight=None):
+		# only marks the cells to redraw, they are redrawn together on the next frame
+		zone = list(zone or [])
+		pressed = list(pressed or [])
 
 		if (all):
-			zone = [(row, col) for row in range(self.minefield.rows) for col in range(self.minefield.cols)]
-		elif (hasattr(self, "highlighted_cells") and self.highlighted_cells):
+			self.dirtyAll = True
+			self.highlighted_cells = []
+			self.pressed_cells.clear()
+		else:
 			zone.extend(self.highlighted_cells)
 			self.highlighted_cells = []
 
-		for row, col in zone:
-			cell = self.layout.itemAtPosition(row, col).widget()
-
-			self.displayCell(
-				cell,
-				self.minefield.field[row][col],
-				highlight=((row, col) in highlight),
-				scale=scale,
-				game_lost=game_lost
-			)
+			for pos in zone:
+				self.pressed_cells.discard(pos)
 
 		if (highlight):
-			self.highlighted_cells = highlight
-
-		if (pressed):
-			for row, col in pressed:
-				cell = self.layout.itemAtPosition(row, col).widget()
-				cell.setStyleSheet(
-					"background-color: lightgray;"
-					f"border-top: {str(4*scale)}px solid gray;"
-					f"border-left: {str(4*scale)}px solid gray;"
-					f"border-right: {str(2*scale)}px solid whitesmoke;"
-					f"border-bottom: {str(2*scale)}px solid whitesmoke;"
-				)
+			self.highlighted_cells = list(highlight)
 
+		self.pressed_cells.update(pressed)
+		self.dirtyCells.update(zone)
+		self.dirtyCells.update(pressed)
 
+		if (not self.frameTimer.isActive()):
+			self.frameTimer.start()
 
-	def displayCell(self, cell: QtWidgets.QLabel, cell_data: dict, highlight=False, scale=1, game_lost=False):
-		text = ""
-		background_color = ""
-		color = ""
+	def drawFrame(self):
+		# repaint the cells that look different since the last frame
+		if (self.dirtyAll):
+			self.update()
+		else:
+			game_lost = self.minefield.isLost()
+			for row, col in self.dirtyCells:
+				if (self.cellVisual(row, col, game_lost) != self.cellVisuals[row*self.minefield.cols + col]):
+					self.update(self.cellRect(row, col))
 
-		border_topleft = ""
-		border_bottomright = ""
+		self.dirtyAll = False
+		self.dirtyCells = set()
 
-		font_size = 12
+	def cellRect(self, row, col):
+		return QtCore.QRect(col*self.cell_size, row*self.cell_size, self.cell_size, self.cell_size)
 
-		if (cell_data["isOpen"]):
-			border_topleft = f"{str(0*scale)}px solid gray; padding-top: {str(4*scale)}px; padding-left: {str(4*scale)}px"
-			border_bottomright = f"{str(2*scale)}px solid gray; padding-bottom: {str(2*scale)}px; padding-right: {str(2*scale)}px"
-			if (cell_data["isMine"]):
-				text = "*"
-				background_color = "red"
-				color = "black"
-			else:
-				font_size = 14
-				background_color = "lightgray"
-
-				match cell_data["mines"]:
-					case 1:
-						text = "1"
-						color = "blue"
-					case 2:
-						text = "2"
-						color = "green"
-					case 3:
-						text = "3"
-						color = "red"
-					case 4:
-						text = "4"
-						color = "darkblue"
-					case 5:
-						text = "5"
-						color = "brown"
-					case 6:
-						text = "6"
-						color = "darkcyan"
-					case 7:
-						text = "7"
-						color = "black"
-					case 8:
-						text = "8"
-						color = "gray"
+	def cellAt(self, event: QtGui.QMouseEvent):
+		row, col = int(event.position().y()//self.cell_size), int(event.position().x()//self.cell_size)
+		if (0 <= row < self.minefield.rows and 0 <= col < self.minefield.cols):
+			return row, col
+		return None
+
+
+
+	def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+		scale = (min(self.width()/self.minefield.cols, self.height()/self.minefield.rows))/30
+		game_lost = self.minefield.isLost()
+		region = event.region()
+		rect = event.rect()
+
+		painter = QtGui.QPainter(self)
+
+		# only the cells inside the dirty region
+		for row in range(max(rect.top()//self.cell_size, 0), min(rect.bottom()//self.cell_size + 1, self.minefield.rows)):
+			for col in range(max(rect.left()//self.cell_size, 0), min(rect.right()//self.cell_size + 1, self.minefield.cols)):
+				if (not region.intersects(self.cellRect(row, col))):
+					continue
+
+				visual = self.cellVisual(row, col, game_lost)
+				self.cellVisuals[row*self.minefield.cols + col] = visual
+				painter.drawPixmap(col*self.cell_size, row*self.cell_size, self.cellPixmap(visual, scale))
+
+		painter.end()
+
+	def cellVisual(self, row, col, game_lost):
+		index = row*self.minefield.cols + col
+
+		if ((row, col) in self.pressed_cells):
+			return ("pressed", False)
+
+		if (self.minefield.isOpen[index]):
+			state = "exploded" if self.minefield.isMine[index] else str(self.minefield.nearbyMines[index])
+		elif (self.minefield.isFlag[index]):
+			state = "flag"
+		elif (self.minefield.isMine[index] and game_lost):
+			state = "mine"
 		else:
-			border_topleft = str(4*scale) + "px solid whitesmoke"
-			border_bottomright = str(4*scale) + "px solid gray"
-
-			if (cell_data["isFlag"]):
-				text = "`"
-				background_color = "lightgray"
-				color = "crimson"
-			elif (cell_data["isMine"] and game_lost):
-				text = "*"
-				background_color = "lightgray"
-				color = "black"
-			else:
-				background_color = "lightgray"
-				color = "black"
+			state = "closed"
+
+		return (state, (row, col) in self.highlighted_cells)
+
+	def cellPixmap(self, visual, scale):
+		# every distinct look is drawn once per scale, then only copied
+		key = (scale, self.devicePixelRatioF())
+		if (self.cellPixmapsKey != key):
+			self.cellPixmapsKey = key
+			self.cellPixmaps = {}
+
+		pixmap = self.cellPixmaps.get(visual)
+		if (pixmap is None):
+			pixmap = QtGui.QPixmap(round(self.cell_size*key[1]), round(self.cell_size*key[1]))
+			pixmap.setDevicePixelRatio(key[1])
+
+			painter = QtGui.QPainter(pixmap)
+			self.displayCell(painter, QtCore.QRect(0, 0, self.cell_size, self.cell_size), *visual, scale=scale)
+			painter.end()
+
+			self.cellPixmaps[visual] = pixmap
+
+		return pixmap
+
+	def displayCell(self, painter: QtGui.QPainter, rect: QtCore.QRect, state: str, highlight=False, scale=1):
+		text = ""
+		background_color = "lightgray"
+		color = "black"
+
+		font_size = 12
+
+		match state:
+			case "pressed":
+				border_topleft = (4*scale, "gray")
+				border_bottomright = (2*scale, "whitesmoke")
+			case "exploded" | "0" | "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8":
+				border_topleft = (0, "gray")
+				border_bottomright = (2*scale, "gray")
+				if (state == "exploded"):
+					text = "*"
+					background_color = "red"
+				elif (state != "0"):
+					font_size = 14
+					text = state
+					color = ("blue", "green", "red", "darkblue", "brown", "darkcyan", "black", "gray")[int(state)-1]
+			case _:
+				border_topleft = (4*scale, "whitesmoke")
+				border_bottomright = (4*scale, "gray")
+
+				if (state == "flag"):
+					text = "`"
+					color = "crimson"
+				elif (state == "mine"):
+					text = "*"
 
 		if (highlight):
 			background_color = "palegoldenrod"
 
-		cell.setText(text)
-		cell.setStyleSheet(
-			f"background-color: {background_color};"
-			f"color: {color};"
-			f"border-top: {border_topleft};"
-			f"border-left: {border_topleft};"
-			f"border-right: {border_bottomright};"
-			f"border-bottom: {border_bottomright};"
-		)
+		painter.fillRect(rect, QtGui.QColor(background_color))
+		drawBevel(painter, rect, border_topleft, border_bottomright)
 
-		cell.setFont(QtGui.QFont(self.minesweeperFontID, font_size*scale))
+		if (text):
+			font = QtGui.QFont(self.minesweeperFontID)
+			font.setPointSizeF(font_size*scale)
+			painter.setFont(font)
+			painter.setPen(QtGui.QColor(color))
+			# the text sits inside the borders & padding, like the old labels
+			painter.drawText(QtCore.QRectF(rect).adjusted(4*scale, 4*scale, -4*scale, -4*scale), QtCore.Qt.AlignCenter, text)
 
 	def updateCursor(self, row, col):
-		cell = self.layout.itemAtPosition(row, col).widget()
-		cellData = self.minefield.field[row][col]
-
-		if (self.minefield.open(*cellData["pos"], nearbyOpening=options["autoMode"], nearbyFlagging=options["autoMode"], checkIsActive=True)):
-			cell.setCursor(QtCore.Qt.PointingHandCursor)
+		if (self.minefield.isActionable(row*self.minefield.cols + col, options["autoMode"], options["autoMode"])):
+			self.setCursor(QtCore.Qt.PointingHandCursor)
 		else:
-			cell.setCursor(QtCore.Qt.ArrowCursor)
+			self.setCursor(QtCore.Qt.ArrowCursor)
 
 	def updateTitle(self):
 		self.setWindowTitle(f"zweeper - {self.minefield.mines - self.minefield.flags} flags left - press K for keybinds")
 
 
 
+	def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
+		# the pressed cell gets the release & moves until the buttons are up, like a mouse grab
+		if (self.grabbedPos is None):
+			self.grabbedPos = self.cellAt(event)
+
+		if (self.grabbedPos is not None):
+			self.cellPress(event, *self.grabbedPos)
+
+	def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
+		pos = self.grabbedPos
+		if (not event.buttons()):
+			self.grabbedPos = None
+
+		if (pos is not None):
+			self.cellRelease(event, *pos)
+
+	def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:
+		pos = self.grabbedPos if event.buttons() else self.cellAt(event)
+
+		if (pos is not None):
+			self.cellMouseMove(event, *pos)
+
 	def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
 		self.updateUI(True)
 
+	def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+		self.generator.close()
+		self.pregenerator.close()
+
+		for thread in (self.generation, self.pregeneration):
+			if (thread is not None): thread.wait()
+
+		if (self.boardCache): self.boardCache.close()
+
 	def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
+		if (self.generation is not None):
+			return
+
 		match event.key():
 			case QtCore.Qt.Key_R:
-				self.minefield.initialize()
+				self.newGame()
 				#while (self.minefield.field[0][0]["mines"] != 0 or self.minefield.isSolvableFrom(0, 0, restore=False)):
 				#	self.minefield.initialize()
 				self.updateUI(True)
@@ -245,7 +351,7 @@ class zweeper(QtWidgets.QWidget):
 			case QtCore.Qt.Key_S:
 				try:
 					settings = QtCore.QSettings("zweeper", "zweeper")
-					settings.setValue("game", self.minefield.save())
+					settings.setValue("game", QtCore.QByteArray(self.minefield.save()))
 
 					showMessageBox("Game Saved", "Game saved successfully")
 				except:
@@ -255,7 +361,8 @@ class zweeper(QtWidgets.QWidget):
 				load = QtCore.QSettings("zweeper", "zweeper").value("game")
 				if (load):
 					try:
-						self.minefield = Minefield.load(load)
+						# older versions saved the game as a JSON string
+						self.minefield = Minefield.load(load.data() if isinstance(load, QtCore.QByteArray) else load)
 						self.updateUI(True)
 						self.updateTitle()
 
@@ -292,43 +399,124 @@ class zweeper(QtWidgets.QWidget):
 
 
 
+	def newGame(self):
+		# generated no-guess boards are not lazy, the next board is
+		self.minefield = Minefield(self.minefield.rows, self.minefield.cols, self.minefield.mines, lazy=True, safeZone=options["safeZone"])
+		self.pregenerate()
+
+	def pregenerate(self):
+		# the next no-guess board is generated in the background, with every first click it can be solved from
+		if (options["noGuessMode"] and self.nextBoard is None and self.pregeneration is None):
+			self.pregeneration = zweeper_generation(self, self.pregenerator.generateAnyStart, options["pregenerationTimeout"])
+			self.pregeneration.generated.connect(self.pregenerationDone)
+			self.pregeneration.start()
+
+	def pregenerationDone(self, result):
+		self.pregeneration.wait()
+		self.pregeneration = None
+		self.nextBoard = result
+
+	def takeGeneratedBoard(self, row, col):
+		if (self.nextBoard is not None and row*self.minefield.cols + col in self.nextBoard[1]):
+			minefield, self.nextBoard = self.nextBoard[0], None
+			return minefield
+
+		if (self.boardCache):
+			return self.boardCache.take(self.minefield.rows, self.minefield.cols, self.minefield.mines, row, col)
+
+		return None
+
+	def startGeneration(self, row, col):
+		# generate off the main thread, cancelling falls back to a normal board
+		self.pregenerator.cancel()
+
+		self.generationPos = (row, col)
+		self.generationStart = time.monotonic()
+
+		self.progressDialog = QtWidgets.QProgressDialog("Generating a no-guess board", "Play without no-guess", 0, 0, self)
+		self.progressDialog.setWindowTitle("zweeper")
+		self.progressDialog.setWindowModality(QtCore.Qt.WindowModal)
+		# with a 0..0 range the value starts at -1, the show timer only restarts from the minimum value
+		self.progressDialog.setValue(0)
+		self.progressDialog.setMinimumDuration(500)
+		self.progressDialog.canceled.connect(self.generator.cancel)
+
+		self.generation = zweeper_generation(self, self.generator.generate, row, col)
+		self.generation.generated.connect(self.generationDone)
+		self.generation.start()
+		self.progressTimer.start()
+
+	def updateProgress(self):
+		self.progressDialog.setLabelText(f"Generating a no-guess board\n{self.generator.candidates} candidates checked in {time.monotonic() - self.generationStart:.1f}s")
+
+	def generationDone(self, minefield):
+		self.progressTimer.stop()
+		self.progressDialog.canceled.disconnect()
+		self.progressDialog.hide()
+		self.progressDialog.deleteLater()
+
+		self.generation.wait()
+		self.generation = None
+
+		if (minefield is not None):
+			self.minefield = minefield
+			self.updateUI(True)
+
+		row, col = self.generationPos
+		self.openCell(row, col)
+		self.updateTitle()
+		self.updateCursor(row, col)
+
+
+
 	def cellPress(self, event: QtGui.QMouseEvent, row: int, col: int):
+		if (self.generation is not None):
+			return
+
 		cellData = self.minefield.field[row][col]
 
 		if (event.button() == QtCore.Qt.LeftButton and not cellData["isOpen"] and not cellData["isFlag"]):
 			self.updateUI(pressed=[(row, col)])
 
 	def cellRelease(self, event: QtGui.QMouseEvent, row: int, col: int):
+		if (self.generation is not None):
+			return
+
 		cellData = self.minefield.field[row][col]
 
 		if (event.button() == QtCore.Qt.LeftButton and not cellData["isFlag"]):
 			if (self.minefield.isNew() and options["noGuessMode"]):
-				while (not self.minefield.isSolvableFrom(*cellData["pos"])):
-					self.minefield.initialize()
-				self.updateUI(True)
+				minefield = self.takeGeneratedBoard(row, col)
 
-			zone = self.minefield.open(*cellData["pos"], nearbyOpening=options["autoMode"], nearbyFlagging=options["autoMode"])
-			self.updateUI(zone=[cell["pos"] for cell in zone])
+				if (minefield is None):
+					self.startGeneration(row, col)
+					return
 
-			if (self.minefield.isOver()):
-				self.updateUI(zone=[cell["pos"] for cell in self.minefield.flat if cell["isMine"] and not cell["isFlag"]])
-				self.onGameOver()
-				self.minefield.initialize()
+				# the game started, the workers don't keep searching for the next board while it's played
+				self.pregenerator.cancel()
+				self.minefield = minefield
 				self.updateUI(True)
-				self.updateTitle()
 
-		elif (event.button() == QtCore.Qt.RightButton):
-			if (not cellData["isOpen"]):
-				if (cellData["isFlag"]):
-					cellData["isFlag"] = False
-				elif (self.minefield.flags < self.minefield.mines):
-					cellData["isFlag"] = True
+			self.openCell(row, col)
 
+		elif (event.button() == QtCore.Qt.RightButton):
+			if (self.minefield.toggleFlag(row, col)):
 				self.updateUI(zone=[cellData["pos"]])
 
 		self.updateTitle()
 		self.updateCursor(row, col)
 
+	def openCell(self, row, col):
+		zone = self.minefield.open(row, col, nearbyOpening=options["autoMode"], nearbyFlagging=options["autoMode"])
+		self.updateUI(zone=[cell["pos"] for cell in zone])
+
+		if (self.minefield.isOver()):
+			self.updateUI(zone=[cell["pos"] for cell in self.minefield.flat if cell["isMine"] and not cell["isFlag"]])
+			self.onGameOver()
+			self.newGame()
+			self.updateUI(True)
+			self.updateTitle()
+
 	def cellMouseMove(self, event: QtGui.QMouseEvent, row: int, col: int):
 		if (self.lastMousePos != (row, col)):
 			self.lastMousePos = (row, col)
@@ -351,6 +539,24 @@ class zweeper(QtWidgets.QWidget):
 
 
 
+class zweeper_generation(QtCore.QThread):
+	generated = QtCore.Signal(object)
+
+	def __init__(self, parent, task, *args):
+		super().__init__(parent)
+		self.task = task
+		self.args = args
+
+	def run(self):
+		try:
+			result = self.task(*self.args)
+		except Exception:
+			result = None
+
+		self.generated.emit(result)
+
+
+
 class zweeper_size_prompt(QtWidgets.QWidget):
 	def __init__(self):
 		super().__init__()
@@ -463,6 +669,8 @@ class zweeper_size_prompt(QtWidgets.QWidget):
 
 
 if __name__ == "__main__":
+	multiprocessing.freeze_support()
+
 	app = QtWidgets.QApplication(sys.argv)
 	ex = zweeper_size_prompt()
 	sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,104 @@
+import time, json, argparse, multiprocessing
+
+from zweeper_engine import Minefield, generateSeed
+
+
+
+def playGame(args):
+	rows, cols, mines, seed, start = args
+	minefield = Minefield(rows, cols, mines, seed)
+	row, col = start or (rows//2, cols//2)
+
+	moves = 1
+	guesses = 0
+	solverTime = 0
+
+	minefield.open(row, col)
+
+	while (not minefield.isOver()):
+		startTime = time.perf_counter()
+		safeCells, mineCells = minefield.getDeductions()
+		guessCell = minefield.getSafestGuess() if len(safeCells) == 0 and len(mineCells) == 0 else None
+		solverTime += time.perf_counter() - startTime
+
+		if (guessCell is not None):
+			safeCells = [guessCell]
+			guesses += 1
+		elif (len(safeCells) == 0 and len(mineCells) == 0):
+			break
+
+		for cell in mineCells:
+			if (minefield.toggleFlag(*cell["pos"])):
+				moves += 1
+
+		for cell in safeCells:
+			if (not cell["isOpen"]):
+				minefield.open(*cell["pos"])
+				moves += 1
+
+	return {
+		"seed": seed,
+		"won": minefield.isCleared(),
+		"moves": moves,
+		"guesses": guesses,
+		"solverTime": solverTime,
+	}
+
+def playGames(rows, cols, mines, games=100, start=None, seed=None, processes=None, progress=None):
+	# with a seed the same games are played every time
+	seeds = [f"{seed}/{i}" if seed is not None else generateSeed() for i in range(games)]
+	startTime = time.perf_counter()
+	results = []
+
+	with multiprocessing.Pool(processes) as pool:
+		for result in pool.imap_unordered(playGame, [(rows, cols, mines, gameSeed, start) for gameSeed in seeds], chunksize=4):
+			results.append(result)
+			if (progress): progress(len(results), sum(result["won"] for result in results))
+
+	wins = sum(result["won"] for result in results)
+	moves = sum(result["moves"] for result in results)
+
+	return {
+		"rows": rows,
+		"cols": cols,
+		"mines": mines,
+		"games": len(results),
+		"wins": wins,
+		"winRate": wins/max(len(results), 1),
+		"movesPerGame": moves/max(len(results), 1),
+		"guessesPerGame": sum(result["guesses"] for result in results)/max(len(results), 1),
+		"solverTimePerMove": sum(result["solverTime"] for result in results)/max(moves, 1),
+		"time": time.perf_counter() - startTime,
+	}
+
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Play games without the GUI and report how the solver does")
+	parser.add_argument("rows", type=int)
+	parser.add_argument("cols", type=int)
+	parser.add_argument("mines", type=int)
+	parser.add_argument("--games", type=int, default=100)
+	parser.add_argument("--start", type=int, nargs=2, default=None, metavar=("ROW", "COL"), help="first cell opened, the center by default")
+	parser.add_argument("--seed", default=None, help="play the same games on every run")
+	parser.add_argument("--processes", type=int, default=None)
+	parser.add_argument("--output", default=None, help="write the JSON report to this file")
+	args = parser.parse_args()
+
+	def progress(played, wins):
+		print(f"\rplayed {played}/{args.games}, won {wins}", end="", flush=True)
+
+	report = playGames(args.rows, args.cols, args.mines, args.games, args.start, args.seed, args.processes, progress)
+	print()
+
+	if (args.output):
+		with open(args.output, "w") as file:
+			json.dump(report, file, indent="\t")
+
+	print(json.dumps(report, indent="\t"))
+
+
+
+if __name__ == "__main__":
+	multiprocessing.freeze_support()
+	main()
@@ -0,0 +1,284 @@
+import gc, sys, time, json, argparse, platform, statistics
+
+from zweeper_engine import Minefield, NUMPY_BACKEND
+
+
+
+SIZES = [(9, 9, 10), (16, 16, 40), (16, 30, 99), (30, 30, 200), (100, 100, 1000), (250, 250, 6250)]
+
+
+
+def getEmptyIndex(minefield):
+	# the empty cell with the largest zone, so flood fills have something to fill
+	bestIndex, bestSize = None, 0
+	checked = bytearray(minefield.rows*minefield.cols)
+
+	for index in range(minefield.rows*minefield.cols):
+		if (minefield.nearbyMines[index] == 0 and not minefield.isMine[index] and not checked[index]):
+			zone = minefield.getEmptyZoneIndexes([index])
+			for zoneIndex in zone:
+				checked[zoneIndex] = 1
+
+			if (len(zone) > bestSize):
+				bestIndex, bestSize = index, len(zone)
+
+	if (bestIndex is None):
+		raise ValueError("no empty cell")
+
+	return bestIndex
+
+def getNumberIndex(minefield):
+	for index in range(minefield.rows*minefield.cols):
+		if (minefield.nearbyMines[index] != 0 and not minefield.isMine[index]):
+			return index
+
+	raise ValueError("no number cell")
+
+def getNumberMinefield(rows, cols, mines, seed):
+	minefield = Minefield(rows, cols, mines, seed)
+	return minefield, minefield.indexToPosition(getNumberIndex(minefield))
+
+def getEmptyMinefield(rows, cols, mines, seed):
+	minefield = Minefield(rows, cols, mines, seed)
+	return minefield, minefield.indexToPosition(getEmptyIndex(minefield))
+
+def getPlayedMinefield(rows, cols, mines, seed):
+	minefield = Minefield(rows, cols, mines, seed)
+	minefield.open(*minefield.indexToPosition(getEmptyIndex(minefield)), firstMoveCheck=False)
+	return minefield
+
+def getChordMinefield(rows, cols, mines, seed):
+	# flag the mines around the open area, so every number next to them can be chorded
+	minefield = getPlayedMinefield(rows, cols, mines, seed)
+	offsets, neighbors = minefield.adjacency
+
+	for index in range(rows*cols):
+		if (minefield.isOpen[index]):
+			for nearbyIndex in neighbors[offsets[index]:offsets[index+1]]:
+				if (minefield.isMine[nearbyIndex]): minefield.setFlag(nearbyIndex)
+
+	chords = [minefield.indexToPosition(index) for index in range(rows*cols) if minefield.isOpen[index] and minefield.nearbyMines[index] != 0]
+	return minefield, chords
+
+
+
+# every case: name -> (setup, run), only run is timed. a setup raises ValueError when the size has no board for it
+CASES = {
+	"init": (
+		lambda rows, cols, mines, seed: (rows, cols, mines, seed),
+		lambda args: Minefield(*args),
+	),
+	"openSingle": (
+		getNumberMinefield,
+		lambda args: args[0].open(*args[1], firstMoveCheck=False),
+	),
+	"openFlood": (
+		getEmptyMinefield,
+		lambda args: args[0].open(*args[1], firstMoveCheck=False),
+	),
+	"openChord": (
+		getChordMinefield,
+		lambda args: [args[0].open(*pos, firstMoveCheck=False, nearbyOpening=True) for pos in args[1]],
+	),
+	"getEmptyZone": (
+		getEmptyMinefield,
+		lambda args: args[0].getEmptyZone(*args[1]),
+	),
+	"isSolvableFrom": (
+		getEmptyMinefield,
+		lambda args: args[0].isSolvableFrom(*args[1], firstMoveCheck=False),
+	),
+	"getHint": (
+		getPlayedMinefield,
+		lambda minefield: minefield.getHint(),
+	),
+	"saveLoad": (
+		getPlayedMinefield,
+		lambda minefield: Minefield.load(minefield.save()),
+	),
+	"visualize": (
+		getPlayedMinefield,
+		lambda minefield: minefield.visualize(unicode=True, color=True, log=False),
+	),
+}
+
+
+
+def timeCase(setup, run, args, minTime=0.01, rounds=50):
+	# a single call can take a few microseconds, so the case is set up & called again until the calls add up
+	# to minTime (or after rounds calls) and the fastest call is kept. gc is off while timing, like timeit
+	best, total = None, 0
+
+	for _ in range(rounds):
+		state = setup(*args)
+
+		gc.disable()
+		try:
+			startTime = time.perf_counter()
+			run(state)
+			elapsed = time.perf_counter() - startTime
+		finally:
+			gc.enable()
+
+		best = elapsed if best is None else min(best, elapsed)
+		total += elapsed
+
+		if (total >= minTime):
+			break
+
+	return best
+
+def calibrate(rounds=20):
+	# a fixed pure python loop, timed before every case so compare can take out how fast the machine was at the time
+	best = None
+
+	for _ in range(rounds):
+		startTime = time.perf_counter()
+		sum(index*index for index in range(20000))
+		elapsed = time.perf_counter() - startTime
+		best = elapsed if best is None else min(best, elapsed)
+
+	return best
+
+def runCase(rows, cols, mines, name, repeat):
+	setup, run = CASES[name]
+	times = []
+	calibration = calibrate()
+
+	# fixed seeds, so every run times the same boards
+	try:
+		for i in range(repeat):
+			times.append(timeCase(setup, run, (rows, cols, mines, f"benchmark/{i}")))
+	except ValueError as error:
+		# e.g. no empty cell on a board full of mines, the case is skipped for this size only
+		return {"skipped": str(error)}
+
+	return {"best": min(times), "median": statistics.median(times), "calibration": calibration}
+
+def runBenchmarks(sizes=SIZES, cases=None, repeat=10, progress=None):
+	results = {}
+
+	# the first loops of a process run slower, they are left out
+	calibrate()
+
+	for rows, cols, mines in sizes:
+		sizeResults = results[f"{rows}x{cols}/{mines}"] = {}
+
+		for name in cases or CASES:
+			sizeResults[name] = runCase(rows, cols, mines, name, repeat)
+			if (progress): progress(f"{rows}x{cols}/{mines}", name, sizeResults[name])
+
+	return {
+		"python": platform.python_version(),
+		"numpy": NUMPY_BACKEND,
+		"repeat": repeat,
+		"results": results,
+	}
+
+def compareBenchmarks(baseline, current, threshold=0.1):
+	# a case regresses when its best time grows by more than the threshold, once scaled by how much slower
+	# the machine ran the calibration loop before it. a faster calibration is not held against a case, it's noise as often
+	comparisons = []
+
+	for size, sizeResults in current["results"].items():
+		for name, timing in sizeResults.items():
+			if ("best" in timing and "best" in baseline["results"].get(size, {}).get(name, {})):
+				baseTime = baseline["results"][size][name]["best"]
+				baseCalibration = baseline["results"][size][name].get("calibration")
+				speed = min(1, baseCalibration/timing["calibration"]) if (baseCalibration and timing.get("calibration")) else 1
+				ratio = timing["best"]*speed/baseTime if baseTime > 0 else 1
+				comparisons.append((size, name, baseTime, timing["best"], ratio, ratio > 1 + threshold))
+
+	return comparisons
+
+def recheckRegressions(baseline, current, threshold=0.1, retries=2, progress=None):
+	# a moment the machine ran slower can flag a case, a real regression is still slow when timed again.
+	# every flagged case is timed again & keeps its fastest result, once scaled by the calibration
+	for _ in range(retries):
+		regressions = [(size, name) for size, name, *_, isRegression in compareBenchmarks(baseline, current, threshold) if isRegression]
+
+		if (len(regressions) == 0):
+			break
+
+		for size, name in regressions:
+			rows, cols, mines = parseSize(size)
+			timing = runCase(rows, cols, mines, name, current["repeat"])
+			previous = current["results"][size][name]
+
+			if ("best" in timing and timing["best"]/timing["calibration"] < previous["best"]/previous["calibration"]):
+				current["results"][size][name] = timing
+
+			if (progress): progress(size, name, current["results"][size][name])
+
+	return compareBenchmarks(baseline, current, threshold)
+
+def parseSize(size):
+	return tuple(int(value) for value in size.replace("/", "x").split("x"))
+
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark the engine hot paths")
+	subparsers = parser.add_subparsers(dest="mode", required=True)
+
+	runParser = subparsers.add_parser("run", help="time every case and print or store the results")
+	runParser.add_argument("--output", default=None, help="write the results as a JSON baseline")
+
+	compareParser = subparsers.add_parser("compare", help="time every case and compare with a baseline")
+	compareParser.add_argument("baseline")
+	compareParser.add_argument("current", nargs="?", default=None, help="results to compare instead of running again")
+	compareParser.add_argument("--threshold", type=float, default=0.1, help="slowdown allowed before a regression, 0.1 = 10%%")
+	compareParser.add_argument("--retries", type=int, default=2, help="times a flagged case is timed again before it counts as a regression")
+
+	for subparser in (runParser, compareParser):
+		subparser.add_argument("--sizes", nargs="+", default=None, metavar="ROWSxCOLS/MINES")
+		subparser.add_argument("--cases", nargs="+", default=None, choices=list(CASES))
+		subparser.add_argument("--repeat", type=int, default=10, help="seeds timed per case")
+
+	args = parser.parse_args()
+
+	sizes = SIZES
+	if (args.sizes):
+		sizes = [parseSize(size) for size in args.sizes]
+
+	def progress(size, name, timing):
+		if ("skipped" in timing):
+			print(f"{size:>16} {name:<16} skipped: {timing['skipped']}", file=sys.stderr)
+			return
+
+		print(f"{size:>16} {name:<16} best {timing['best']*1000:10.3f}ms  median {timing['median']*1000:10.3f}ms", file=sys.stderr)
+
+	if (args.mode == "compare" and args.current):
+		with open(args.current) as file:
+			results = json.load(file)
+	else:
+		results = runBenchmarks(sizes, args.cases, args.repeat, progress)
+
+	if (args.mode == "run"):
+		if (args.output):
+			with open(args.output, "w") as file:
+				json.dump(results, file, indent="\t")
+		else:
+			print(json.dumps(results, indent="\t"))
+		return
+
+	with open(args.baseline) as file:
+		baseline = json.load(file)
+
+	if (args.current):
+		comparisons = compareBenchmarks(baseline, results, args.threshold)
+	else:
+		comparisons = recheckRegressions(baseline, results, args.threshold, args.retries, progress)
+
+	for size, name, baseTime, currentTime, ratio, isRegression in comparisons:
+		print(f"{size:>16} {name:<16} {baseTime*1000:10.3f}ms -> {currentTime*1000:10.3f}ms  {ratio:6.2f}x{'  REGRESSION' if isRegression else ''}")
+
+	regressions = sum(comparison[-1] for comparison in comparisons)
+	print(f"{regressions} regression(s) over {args.threshold:.0%}")
+
+	sys.exit(1 if regressions > 0 else 0)
+
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,138 @@
+import os, time, sqlite3, argparse, multiprocessing
+
+from zweeper_engine import Minefield, Seed64, generateSeed
+
+
+
+def getDefaultPath():
+	cacheDir = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+	return os.path.join(cacheDir, "zweeper", "boards.sqlite")
+
+def findSolvableStarts(args):
+	rows, cols, mines, seed = args
+	return seed, Minefield(rows, cols, mines, seed).getSolvableStartIndexes()
+
+def encodeSeed(seed):
+	# the seed column is text, so int seeds are marked to come back as the same kind of seed & the same board.
+	# string seeds starting with a mark are escaped
+	if (isinstance(seed, Seed64)): return f"#{int(seed)}"
+	if (isinstance(seed, int)): return f"={int(seed)}"
+	return f"\\{seed}" if seed.startswith(("#", "=", "\\")) else seed
+
+def decodeSeed(seed):
+	match seed[:1]:
+		case "#": return Seed64(int(seed[1:]))
+		case "=": return int(seed[1:])
+		case "\\": return seed[1:]
+		case _: return seed
+
+
+
+class BoardCache:
+	def __init__(self, path=None, capacity=20):
+		self.path = path or getDefaultPath()
+		self.capacity = capacity
+
+		os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+		self.connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+		self.connection.execute("CREATE TABLE IF NOT EXISTS boards (rows INTEGER, cols INTEGER, mines INTEGER, start INTEGER, seed TEXT, created REAL)")
+		self.connection.execute("CREATE INDEX IF NOT EXISTS boardsByStart ON boards (rows, cols, mines, start, created)")
+		self.connection.commit()
+
+	def put(self, rows, cols, mines, seed, starts):
+		created = time.time()
+
+		with self.connection:
+			self.connection.executemany("INSERT INTO boards VALUES (?, ?, ?, ?, ?, ?)", [(rows, cols, mines, start, encodeSeed(seed), created) for start in starts])
+
+			# evict the oldest boards of every start cell over capacity
+			for start in starts:
+				self.connection.execute(
+					"DELETE FROM boards WHERE rowid IN ("
+					"SELECT rowid FROM boards WHERE rows = ? AND cols = ? AND mines = ? AND start = ? "
+					"ORDER BY created DESC, rowid DESC LIMIT -1 OFFSET ?)",
+					(rows, cols, mines, start, self.capacity)
+				)
+
+	def take(self, rows, cols, mines, row, col):
+		with self.connection:
+			found = self.connection.execute(
+				"SELECT seed FROM boards WHERE rows = ? AND cols = ? AND mines = ? AND start = ? ORDER BY created, rowid LIMIT 1",
+				(rows, cols, mines, row*cols+col)
+			).fetchone()
+
+			if (found is None):
+				return None
+
+			# a board is handed out once, whatever start cells it was stored for
+			self.connection.execute("DELETE FROM boards WHERE rows = ? AND cols = ? AND mines = ? AND seed = ?", (rows, cols, mines, found[0]))
+
+		return Minefield(rows, cols, mines, decodeSeed(found[0]))
+
+	def count(self, rows, cols, mines):
+		counts = [0]*(rows*cols)
+
+		for start, count in self.connection.execute("SELECT start, COUNT(*) FROM boards WHERE rows = ? AND cols = ? AND mines = ? GROUP BY start", (rows, cols, mines)):
+			counts[start] = count
+
+		return counts
+
+	def fill(self, rows, cols, mines, boards=1000, timeout=None, processes=None, progress=None):
+		counts = self.count(rows, cols, mines)
+		deadline = None if timeout is None else time.monotonic() + timeout
+		seeds = [(rows, cols, mines, generateSeed()) for _ in range(boards)]
+		stored = 0
+
+		with multiprocessing.Pool(processes) as pool:
+			for checked, (seed, starts) in enumerate(pool.imap_unordered(findSolvableStarts, seeds, chunksize=8), 1):
+				starts = [start for start in starts if counts[start] < self.capacity]
+
+				if (len(starts) > 0):
+					self.put(rows, cols, mines, seed, starts)
+					stored += 1
+					for start in starts:
+						counts[start] += 1
+
+				if (progress): progress(checked, stored)
+
+				if (deadline is not None and time.monotonic() > deadline):
+					break
+
+		return stored
+
+	def close(self):
+		self.connection.close()
+
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Fill the no-guess board cache")
+	parser.add_argument("rows", type=int)
+	parser.add_argument("cols", type=int)
+	parser.add_argument("mines", type=int)
+	parser.add_argument("--boards", type=int, default=1000, help="candidate boards to check")
+	parser.add_argument("--timeout", type=float, default=None, help="stop after this many seconds")
+	parser.add_argument("--capacity", type=int, default=20, help="boards kept per start cell")
+	parser.add_argument("--processes", type=int, default=None)
+	parser.add_argument("--path", default=None)
+	args = parser.parse_args()
+
+	cache = BoardCache(args.path, args.capacity)
+
+	def progress(checked, stored):
+		print(f"\rchecked {checked}/{args.boards}, stored {stored}", end="", flush=True)
+
+	cache.fill(args.rows, args.cols, args.mines, args.boards, args.timeout, args.processes, progress)
+	print()
+
+	counts = cache.count(args.rows, args.cols, args.mines)
+	print(f"{sum(count > 0 for count in counts)}/{len(counts)} start cells stocked")
+
+	cache.close()
+
+
+
+if __name__ == "__main__":
+	multiprocessing.freeze_support()
+	main()
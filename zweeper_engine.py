@@ -1,477 +1,524 @@
-import random, json
+import os, random, json, functools, struct, zlib, base64
+from array import array
+
+from zweeper_solver import Solver, UNKNOWN, SAFE, MINE
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+NUMPY_BACKEND = numpy is not None
+
+SAVE_MAGIC = b"ZWPR"
+SAVE_VERSION = 1
+SEED_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+SEED_MASK = (1 << 64) - 1
+
+# actionable bitmap flags, what a click on the cell would do
+ACTION_OPEN = 1
+ACTION_CHORD = 2
+ACTION_FLAG = 4
 
 
 class Minefield:
-	def __init__(self, rows, cols, mines, seed=None):
+	def __init__(self, rows, cols, mines, seed=None, moves=None, lazy=False, safeZone=1, start=None):
 		self.rows = rows
 		self.cols = cols
 		self.mines = mines
-		self.seed = seed or generateSeed(int(self.rows*self.cols/5))
-		self.field = []
+		self.seed = generateSeed() if seed is None else seed
+		self.moves = []
+
+		# Lazy boards place their mines on the first click, away from it
+		self.lazy = lazy
+		self.safeZone = safeZone
+		self.start = None
 
 		# Initialize the field
-		for i in range(rows):
-			self.field.append([])
-			for j in range(cols):
-				self.field[i].append({
-					"mines": 0,
-					"isMine": False,
-					"isOpen": False,
-					"isFlag": False
-				})
-
-		# Randomize the mines
-		isMineList = [True]*mines + [False]*(rows*cols-mines)
-		random.seed(self.seed)
-		random.shuffle(isMineList)
-
-		# Calculate the number of mines around each cell
-		for i in range(rows):
-			for j in range(cols):
-				index = i*cols+j
-				self.field[i][j]["row"] = i
-				self.field[i][j]["col"] = j
-				self.field[i][j]["pos"] = (i, j)
-				self.field[i][j]["index"] = index
-
-				if (isMineList[index]):
-					self.field[i][j]["isMine"] = True
-					for cell in self.getNearbyCells(i, j, True):
-						cell["mines"] += 1
-
-		# Create a flat list of cells
-		self.flat = []
-		for row in self.field:
-			self.flat.extend(row)
+		self.nearbyMines = bytearray(rows*cols)
+		self.isOpen = bytearray(rows*cols)
+		self.isFlag = bytearray(rows*cols)
+
+		if (lazy):
+			self.isMine = bytearray(rows*cols)
+			if (start is not None):
+				self.placeMines(start)
+		elif (isinstance(self.seed, Seed64)):
+			# Sample the mines from the 64-bit seed
+			self.isMine = bytearray(rows*cols)
+			self.addMines(SplitMix64(self.seed).sample(range(rows*cols), mines))
+		else:
+			# Randomize the mines, the same way older versions did for string & plain int seeds
+			isMineList = [True]*mines + [False]*(rows*cols-mines)
+			random.Random(self.seed).shuffle(isMineList)
+			self.isMine = bytearray(isMineList[:rows*cols])
+
+			# Calculate the number of mines around each cell
+			self.recountMines()
+
+		# Replay the mines moved after generation
+		for fromIndex, toIndex in moves or []:
+			self.moveMine(fromIndex, toIndex)
+
+		# Create the cell views
+		self.field = Field(self)
+		self.flat = CellList(self, 0, rows*cols)
+
+		self.countState()
 
 
 
 	def initialize(self):
-		self.__init__(self.rows, self.cols, self.mines)
+		self.__init__(self.rows, self.cols, self.mines, lazy=self.lazy, safeZone=self.safeZone)
 
 	def restore(self):
-		for row in self.field:
-			for cell in row:
-				cell["isOpen"] = False
-				cell["isFlag"] = False
+		self.isOpen[:] = bytes(self.rows*self.cols)
+		self.isFlag[:] = bytes(self.rows*self.cols)
+		self.countState()
+
+	def countState(self):
+		# deductions & the actionable bitmap are kept between moves, until the board changes behind their back
+		self.hintSolver = None
+		self.actionable = None
+
+		self.openCount = self.isOpen.count(1)
+		self.flagCount = self.isFlag.count(1)
+
+		# cells hold 0 or 1, so and-ing the bitmaps as integers leaves the open mines
+		self.explodedCount = (int.from_bytes(self.isOpen, "big") & int.from_bytes(self.isMine, "big")).bit_count()
+		self.closedSafeCount = self.rows*self.cols - self.isMine.count(1) - self.openCount + self.explodedCount
+
+	def setOpen(self, index, isOpen=True):
+		if (self.isOpen[index] != isOpen):
+			self.isOpen[index] = isOpen
+			change = 1 if isOpen else -1
+
+			self.openCount += change
+			if (self.isMine[index]): self.explodedCount += change
+			else: self.closedSafeCount -= change
+
+			# flags on open cells are not counted, opening or closing a flagged cell recounts
+			if (self.isFlag[index]): self.actionable = None
+			elif (self.actionable is not None): self.updateActionable([index], self.nearbyClosed, -change)
+
+			if (isOpen): self.updateHints([index])
+			else: self.hintSolver = None
+
+	def setFlag(self, index, isFlag=True):
+		if (self.isFlag[index] != isFlag):
+			self.isFlag[index] = isFlag
+			self.flagCount += 1 if isFlag else -1
+
+			if (self.isOpen[index]): self.actionable = None
+			elif (self.actionable is not None): self.updateActionable([index], self.nearbyFlags, 1 if isFlag else -1)
+
+			if (self.hintSolver is not None):
+				# a flag on an unknown cell is taken as a mine, anything else invalidates the deductions
+				if (isFlag and self.hintSolver.known[index] == UNKNOWN):
+					self.hintSolver.setKnown(index, MINE)
+				elif (not isFlag or self.hintSolver.known[index] == SAFE):
+					self.hintSolver = None
+
+	def toggleFlag(self, row, col):
+		index = self.positionToIndex(row, col)
+
+		if (self.isOpen[index]):
+			return False
+
+		if (self.isFlag[index]):
+			self.setFlag(index, False)
+		elif (self.flagCount < self.mines):
+			self.setFlag(index, True)
+		else:
+			return False
+
+		return True
+
+	def updateHints(self, openedIndexes):
+		if (self.hintSolver is not None):
+			if (any(self.isMine[index] or self.hintSolver.known[index] == MINE for index in openedIndexes)):
+				self.hintSolver = None
+			else:
+				self.hintSolver.reveal(openedIndexes)
+
+	def placeMines(self, startIndex):
+		# sample the mines among the cells outside the safe zone, the same way every time for the same seed & first click
+		offsets, neighbors = self.adjacency
+		safeIndexes = [startIndex]
+		if (self.safeZone > 0 and self.rows*self.cols - self.mines > len(neighbors[offsets[startIndex]:offsets[startIndex+1]])):
+			safeIndexes.extend(neighbors[offsets[startIndex]:offsets[startIndex+1]])
+		safeIndexes.sort()
+
+		if (isinstance(self.seed, Seed64)):
+			rng = SplitMix64(self.seed ^ SplitMix64(startIndex).next())
+		else:
+			rng = random.Random(f"{self.seed}/{startIndex}")
+		self.start = startIndex
+
+		mineIndexes = rng.sample(range(self.rows*self.cols - len(safeIndexes)), self.mines)
+
+		# skip over the safe cells
+		if (NUMPY_BACKEND):
+			mineIndexes = numpy.array(mineIndexes, numpy.intp)
+			for safeIndex in safeIndexes:
+				mineIndexes += mineIndexes >= safeIndex
+		else:
+			for i, mineIndex in enumerate(mineIndexes):
+				for safeIndex in safeIndexes:
+					if (mineIndex >= safeIndex): mineIndex += 1
+				mineIndexes[i] = mineIndex
+
+		self.addMines(mineIndexes)
+		self.countState()
+
+	def addMines(self, mineIndexes):
+		# with numpy the bits are set at once & the whole grid recounted, the loop per mine only pays off without it
+		if (NUMPY_BACKEND):
+			numpy.frombuffer(self.isMine, numpy.uint8)[numpy.asarray(mineIndexes, numpy.intp)] = 1
+			self.recountMines()
+			return
+
+		offsets, neighbors = self.adjacency
+
+		for mineIndex in mineIndexes:
+			self.isMine[mineIndex] = 1
+			self.nearbyMines[mineIndex] += 1
+			for nearbyIndex in neighbors[offsets[mineIndex]:offsets[mineIndex+1]]:
+				self.nearbyMines[nearbyIndex] += 1
 
 	def recountMines(self):
-		for cell in self.flat:
-			cell["mines"] = 0
+		if (NUMPY_BACKEND):
+			# 3x3 neighborhood sum over the mine grid, the cell itself included
+			isMine = numpy.pad(numpy.frombuffer(self.isMine, numpy.uint8).reshape(self.rows, self.cols), 1)
+			nearbyMines = numpy.zeros((self.rows, self.cols), numpy.uint8)
+
+			for i in range(3):
+				for j in range(3):
+					nearbyMines += isMine[i:i+self.rows, j:j+self.cols]
+
+			self.nearbyMines[:] = nearbyMines.tobytes()
+			return
 
-		for i in range(self.rows):
-			for j in range(self.cols):
-				if (self.field[i][j]["isMine"]):
-					for cell in self.getNearbyCells(i, j, True):
-						cell["mines"] += 1
+		offsets, neighbors = self.adjacency
+		self.nearbyMines[:] = bytes(self.rows*self.cols)
+
+		for index in range(self.rows*self.cols):
+			if (self.isMine[index]):
+				self.nearbyMines[index] += 1
+				for nearbyIndex in neighbors[offsets[index]:offsets[index+1]]:
+					self.nearbyMines[nearbyIndex] += 1
 
 
 
 	def open(self, row, col, firstMoveCheck=True, nearbyOpening=False, nearbyFlagging=False, checkIsActive=False):
 		index = self.positionToIndex(row, col)
-		updatedCells = []
+		offsets, neighbors = self.adjacency
+		updatedIndexes = []
+
+		if (checkIsActive):
+			return self.isActionable(index, nearbyOpening, nearbyFlagging)
 
 		if (firstMoveCheck):
 			firstMoveCheck = self.isNew()
 
-		def openEmptyZone(row, col):
-			nonlocal updatedCells
-
-			for cell in self.getEmptyZone(row, col):
-				if (not cell["isOpen"]):
-					cell["isOpen"] = True
-					updatedCells.append(cell)
-
-
-		if (not self.flat[index]["isOpen"]):
-			if (checkIsActive): return True
-			if (self.flat[index]["isMine"] and firstMoveCheck):
+		if (not self.isOpen[index]):
+			if (self.lazy and self.start is None):
+				self.placeMines(index)
+			if (self.isMine[index] and firstMoveCheck):
 				self.moveMineToCorner(row, col)
-			openEmptyZone(row, col)
+			updatedIndexes = self.openEmptyZones([index])
 
-		elif (self.flat[index]["mines"] != 0):
+		elif (self.nearbyMines[index] != 0):
 			if (nearbyOpening or nearbyFlagging):
 				nearbyClosedCellsCount = 0
 				nearbyFlaggedCellsCount = 0
-				nearbyUnflaggedCells = []
+				nearbyUnflaggedIndexes = []
 
-				for cell in self.getNearbyCells(row, col):
-					if (not cell["isOpen"]):
+				for nearbyIndex in neighbors[offsets[index]:offsets[index+1]]:
+					if (not self.isOpen[nearbyIndex]):
 						nearbyClosedCellsCount += 1
-						if (cell["isFlag"]):
+						if (self.isFlag[nearbyIndex]):
 							nearbyFlaggedCellsCount += 1
 						else:
-							nearbyUnflaggedCells.append(cell)
+							nearbyUnflaggedIndexes.append(nearbyIndex)
 
 				if (nearbyOpening):
-					if (self.flat[index]["mines"] == nearbyFlaggedCellsCount):
-						if (checkIsActive): return True
-						for unflaggedCell in nearbyUnflaggedCells:
-							openEmptyZone(*unflaggedCell["pos"])
+					if (self.nearbyMines[index] == nearbyFlaggedCellsCount):
+						updatedIndexes = self.openEmptyZones(nearbyUnflaggedIndexes)
 				if (nearbyFlagging):
-					if (self.flat[index]["mines"] == nearbyClosedCellsCount):
-						if (checkIsActive): return True
-						for unflaggedCell in nearbyUnflaggedCells:
-							unflaggedCell["isFlag"] = True
-							updatedCells.append(unflaggedCell)
+					if (self.nearbyMines[index] == nearbyClosedCellsCount):
+						for unflaggedIndex in nearbyUnflaggedIndexes:
+							self.setFlag(unflaggedIndex)
+							updatedIndexes.append(unflaggedIndex)
 
-		if (checkIsActive):
-			return False
+		return [Cell(self, updatedIndex) for updatedIndex in updatedIndexes]
 
-		return updatedCells
+	def isSolvableFrom(self, row, col, restore=True, firstMoveCheck=True, stats=None):
+		firstIndex = self.positionToIndex(row, col)
+		self.hintSolver = None
+		self.actionable = None
 
-	def isSolvableFrom(self, row, col, restore=True, firstMoveCheck=True):
-		firstCell = self.field[row][col]
+		if (stats is not None):
+			stats.boards += 1
 
-		if (firstCell["isMine"]):
+		if (self.lazy and self.start is None):
+			self.placeMines(firstIndex)
+
+		if (self.isMine[firstIndex]):
 			if (firstMoveCheck and self.isNew()):
 				self.moveMineToCorner(row, col)
 			else:
+				if (stats is not None): stats.fail("mine at start")
 				return False
 
-		if (firstCell["mines"] == 0):
-			firstCell["isOpen"] = True
+		if (self.nearbyMines[firstIndex] == 0):
+			self.isOpen[firstIndex] = 1
 		else:
+			if (stats is not None): stats.fail("number at start")
 			return False
 
 
-		importantIndexes = [cell["index"] for cell in self.flat if cell["isOpen"]]
+		isSolvable = self.solveOpened(Solver(self, stats))
 
-		updates = True
+		if (restore):
+			self.restore()
+		else:
+			self.countState()
 
-		while (updates):
-			updates = False
+		return isSolvable
 
-			allLinkedGroups = []
+	def solveOpened(self, solver, solvedIndexes=None):
+		stats = solver.stats
 
-			def filterImportantIndexes(index):
-				for nearbyCell in self.getNearbyCells(*self.flat[index]["pos"]):
-					if (not nearbyCell["isOpen"] and not nearbyCell["isFlag"]):
-						return True
+		# open & flag every deduction, revealing the numbers under the opened cells
+		while (solver.solve() or solver.solveGlobal(self.mines) or solver.solveEndgame(self.mines)):
+			safeIndexes, mineIndexes = solver.takeDeductions()
+			if (stats is not None): stats.iterations += 1
 
-				return False
+			for index in mineIndexes:
+				self.isFlag[index] = 1
 
-			importantIndexes = list(filter(filterImportantIndexes, importantIndexes))
+			openedIndexes = self.openEmptyZones(safeIndexes)
 
-			# 1st try: open cells using nearby mines and flags
-			for i in importantIndexes:
-				if (self.flat[i]["mines"] == 0):
-					for emptyCell in self.getEmptyZone(*self.flat[i]["pos"]):
-						if (not emptyCell["isOpen"]):
-							emptyCell["isOpen"] = True
-							importantIndexes.append(emptyCell["index"])
-							updates = True
-				else:
-					nearbyClosedCellsCount = 0
-					nearbyFlaggedCellsCount = 0
-					nearbyUnflaggedIndexes = [[], 0]
-
-					for nearbyCell in self.getNearbyCells(*self.flat[i]["pos"]):
-						if (not nearbyCell["isOpen"]):
-							nearbyClosedCellsCount += 1
-							if (nearbyCell["isFlag"]):
-								nearbyFlaggedCellsCount += 1
-							else:
-								nearbyUnflaggedIndexes[0].append(nearbyCell["index"])
-
-					if (len(nearbyUnflaggedIndexes[0]) > 0):
-						# all nearby unflagged cells are safe -> open them
-						if (self.flat[i]["mines"] == nearbyFlaggedCellsCount):
-							for index in nearbyUnflaggedIndexes[0]:
-								self.flat[index]["isOpen"] = True
-								importantIndexes.append(index)
-							updates = True
-
-						# all nearby unflagged cells are mines -> flag them
-						if (self.flat[i]["mines"] == nearbyClosedCellsCount):
-							for index in nearbyUnflaggedIndexes[0]:
-								self.flat[index]["isFlag"] = True
-							updates = True
-
-						# all nearby unflagged cells have SOME mines -> link them
-						if (self.flat[i]["mines"] > nearbyFlaggedCellsCount):
-							if (not nearbyUnflaggedIndexes in allLinkedGroups):
-								nearbyUnflaggedIndexes[1] = self.flat[i]["mines"] - nearbyFlaggedCellsCount
-								allLinkedGroups.append(nearbyUnflaggedIndexes)
-
-			# 2nd try: link groups of cells
-			if (not updates):
-				shiftUpdates = True
-
-				# adding & shifting linked groups
-				while (shiftUpdates):
-					shiftUpdates = False
-
-					for i in importantIndexes:
-						linkedGroupsSum = [[], 0]
-						nearbyClosedIndexes = []
-						nearbyFlaggedCellsCount = 0
-
-						for nearbyCell in self.getNearbyCells(*self.flat[i]["pos"]):
-							if (nearbyCell["isFlag"]):
-								nearbyFlaggedCellsCount += 1
-							elif (not nearbyCell["isOpen"]):
-								nearbyClosedIndexes.append(nearbyCell["index"])
-
-						for linkedGroup in allLinkedGroups:
-							if (isSublist(nearbyClosedIndexes, linkedGroup[0]) and len(nearbyClosedIndexes) != len(linkedGroup[0])):
-								shiftLinkedGroup = [
-									subtractLists(nearbyClosedIndexes, linkedGroup[0]), # shifting
-									self.flat[i]["mines"] - linkedGroup[1] - nearbyFlaggedCellsCount
-								]
-
-								if (len(shiftLinkedGroup[0]) > 0 and shiftLinkedGroup[1] > 0 and not shiftLinkedGroup in allLinkedGroups):
-									allLinkedGroups.append(shiftLinkedGroup)
-									shiftUpdates = True
-
-								if (not hasDuplicates(linkedGroupsSum[0], linkedGroup[0])): # adding
-									linkedGroupsSum[1] += linkedGroup[1]
-									linkedGroupsSum[0].extend(linkedGroup[0])
-
-						if (len(linkedGroupsSum[0]) > 0 and not linkedGroupsSum in allLinkedGroups):
-							allLinkedGroups.append(linkedGroupsSum)
-							shiftUpdates = True
-
-				# open cells in linked groups
-				for i in importantIndexes:
-					nearbyIndexes = [cell["index"] for cell in self.getNearbyCells(*self.flat[i]["pos"])]
-
-					for linkedGroup in allLinkedGroups:
-						if (hasDuplicates(linkedGroup[0], nearbyIndexes)):
-							nearbyFlaggedCellsCount = 0
-							nearbyUnkownIndexes = []
-
-							for index in nearbyIndexes:
-								if (self.flat[index]["isFlag"]):
-									nearbyFlaggedCellsCount += 1
-								elif (not self.flat[index]["isOpen"] and not index in linkedGroup[0]):
-									nearbyUnkownIndexes.append(index)
-
-							if (len(nearbyUnkownIndexes) > 0):
-								linkedGroupUncontainedCellsCount = len(subtractLists(linkedGroup[0], nearbyIndexes))
-
-								# all unknown cells are mines -> flag them
-								if (self.flat[i]["mines"] == nearbyFlaggedCellsCount + linkedGroup[1] + len(nearbyUnkownIndexes)):
-									for index in nearbyUnkownIndexes:
-										self.flat[index]["isFlag"] = True
-									updates = True
-								# all unknown cells are clear > open them
-								elif (self.flat[i]["mines"] == nearbyFlaggedCellsCount + linkedGroup[1] - linkedGroupUncontainedCellsCount and not updates):
-									for index in nearbyUnkownIndexes:
-										if (not self.flat[index]["isFlag"]):
-											self.flat[index]["isOpen"] = True
-											importantIndexes.append(index)
-											updates = True
-
-			# 3rd try: open cells using remaining flags count
-			if (not updates):
-				flagsCount = 0
-				minesCount = 0
-
-				for cell in self.flat:
-					if (cell["isFlag"]): flagsCount += 1
-					if (cell["isMine"]): minesCount += 1
-
-				if (flagsCount == minesCount):
-					for cell in self.flat:
-						if (not cell["isOpen"] and not cell["isFlag"]):
-							cell["isOpen"] = True
-							importantIndexes.append(cell["index"])
+			# reaching a start already known to be solvable opens everything that start opens
+			if (solvedIndexes is not None and any(solvedIndexes[index] for index in openedIndexes)):
+				return True
+
+			solver.reveal(openedIndexes)
+
+		unknownCount = solver.known.count(UNKNOWN)
+
+		if (stats is not None and unknownCount > 0):
+			stats.fail("stuck" if unknownCount <= 64 else "stuck before the endgame", f"{unknownCount} cells left")
+
+		return unknownCount == 0
+
+	def getSolvableStartIndexes(self):
+		# every empty cell of a zone opens the same area, and a start stuck with another zone already open is stuck there too
+		solvedIndexes = bytearray(self.rows*self.cols)
+		checkedIndexes = bytearray(self.rows*self.cols)
+		self.restore()
+
+		for index in range(self.rows*self.cols):
+			if (self.nearbyMines[index] == 0 and not self.isMine[index] and not checkedIndexes[index]):
+				self.isOpen[index] = 1
+				zoneIndexes = [zoneIndex for zoneIndex in self.getEmptyZoneIndexes([index], True) if self.nearbyMines[zoneIndex] == 0]
+
+				if (self.solveOpened(Solver(self), solvedIndexes)):
+					for zoneIndex in zoneIndexes:
+						solvedIndexes[zoneIndex] = 1
+						checkedIndexes[zoneIndex] = 1
 				else:
-					for linkedGroup in allLinkedGroups:
-						linkedGroup[0].sort()
-					allLinkedGroups.sort()
+					for openIndex in range(self.rows*self.cols):
+						if (self.isOpen[openIndex] and self.nearbyMines[openIndex] == 0):
+							checkedIndexes[openIndex] = 1
 
-					linkedGroupsSum = [[], 0]
+				self.restore()
 
-					for linkedGroup in allLinkedGroups:
-						if (not hasDuplicates(linkedGroupsSum[0], linkedGroup[0])):
-							linkedGroupsSum[1] += linkedGroup[1]
-							linkedGroupsSum[0].extend(linkedGroup[0])
+		return [index for index in range(self.rows*self.cols) if solvedIndexes[index]]
 
-					allLinkedGroups.append(linkedGroupsSum)
+	def getSolvableStarts(self):
+		return [Cell(self, index) for index in self.getSolvableStartIndexes()]
 
-					for linkedGroup in allLinkedGroups:
-						if linkedGroup[1] == minesCount - flagsCount:
-							for cell in self.flat:
-								if (not cell["isOpen"] and not cell["isFlag"] and not cell["index"] in linkedGroup[0]):
-									cell["isOpen"] = True
-									importantIndexes.append(cell["index"])
-									updates = True
+	def getDeductions(self):
+		if (self.isNew() or self.isOver()):
+			return [], []
 
+		if (self.hintSolver is None):
+			self.hintSolver = Solver(self)
 
-		if (restore):
-			self.restore()
+		solver = self.hintSolver
+		solver.solve()
 
-		isSolvable = len(importantIndexes) == 0
+		# deductions the player already acted on are dropped.
+		# the kept solver remembers what earlier moves and global passes deduced, so its hints can differ
+		# from a fresh solve of the same board (more or fewer cells), but every one of them is certain
+		solver.safeIndexes = [index for index in solver.safeIndexes if not self.isOpen[index]]
+		solver.mineIndexes = [index for index in solver.mineIndexes if not self.isFlag[index]]
 
-		return isSolvable
+		if (len(solver.safeIndexes) == 0 and len(solver.mineIndexes) == 0 and (solver.solveGlobal(self.mines) or solver.solveEndgame(self.mines))):
+			solver.solve()
+
+		return [Cell(self, index) for index in solver.safeIndexes], [Cell(self, index) for index in solver.mineIndexes]
 
 	def getHint(self):
-		if (self.isNew()):
+		safeCells, mineCells = self.getDeductions()
+
+		if (len(safeCells) > 0): return safeCells[0]
+		if (len(mineCells) > 0): return mineCells[0]
+
+		return None
+
+	def getProbabilities(self):
+		self.getDeductions()
+
+		if (self.hintSolver is None):
+			return {}
+
+		probabilities = {Cell(self, index): probability for index, probability in self.hintSolver.getProbabilities(self.mines).items()}
+
+		for index in self.hintSolver.safeIndexes: probabilities[Cell(self, index)] = 0.0
+		for index in self.hintSolver.mineIndexes: probabilities[Cell(self, index)] = 1.0
+
+		return probabilities
+
+	def getSafestGuess(self):
+		safeCells, _ = self.getDeductions()
+
+		if (len(safeCells) > 0):
+			return safeCells[0]
+		if (self.hintSolver is None):
 			return None
 
-		def filterImportantIndexes(index):
-			for nearbyCell in self.getNearbyCells(*self.flat[index]["pos"]):
-				if (not nearbyCell["isOpen"] and not nearbyCell["isFlag"]):
-					return True
+		index = self.hintSolver.getSafestGuess(self.mines)
+		return None if index is None else Cell(self, index)
 
-			return False
+	def getActionable(self):
+		if (self.actionable is None):
+			self.recountActionable()
 
-		importantIndexes = [cell["index"] for cell in self.flat if cell["isOpen"]]
-		importantIndexes = list(filter(filterImportantIndexes, importantIndexes))
+		return self.actionable
 
-		allLinkedGroups = []
+	def isActionable(self, index, nearbyOpening=True, nearbyFlagging=True):
+		return self.getActionable()[index] & (ACTION_OPEN | (ACTION_CHORD if nearbyOpening else 0) | (ACTION_FLAG if nearbyFlagging else 0)) != 0
 
-		# 1st try: open cells using nearby mines and flags
-		for i in importantIndexes:
-			if (self.flat[i]["mines"] == 0):
-				for emptyCell in self.getEmptyZone(*self.flat[i]["pos"]):
-					if (not emptyCell["isOpen"]):
-						return emptyCell
-			else:
-				nearbyClosedCellsCount = 0
-				nearbyFlaggedCellsCount = 0
-				nearbyUnflaggedIndexes = [[], 0]
+	def recountActionable(self):
+		# closed & flagged cells around every cell, kept up to date move by move afterwards
+		offsets, neighbors = self.adjacency
 
-				for nearbyCell in self.getNearbyCells(*self.flat[i]["pos"]):
-					if (not nearbyCell["isOpen"]):
-						nearbyClosedCellsCount += 1
-						if (nearbyCell["isFlag"]):
-							nearbyFlaggedCellsCount += 1
-						else:
-							nearbyUnflaggedIndexes[0].append(nearbyCell["index"])
-
-				if (len(nearbyUnflaggedIndexes[0]) > 0):
-					# all nearby unflagged cells are safe -> open them
-					if (self.flat[i]["mines"] == nearbyFlaggedCellsCount):
-						for index in nearbyUnflaggedIndexes[0]:
-							return self.flat[index]
-
-					# all nearby unflagged cells are mines -> flag them
-					if (self.flat[i]["mines"] == nearbyClosedCellsCount):
-						for index in nearbyUnflaggedIndexes[0]:
-							return self.flat[index]
-
-					# all nearby unflagged cells have SOME mines -> link them
-					if (self.flat[i]["mines"] > nearbyFlaggedCellsCount):
-						if (not nearbyUnflaggedIndexes in allLinkedGroups):
-							nearbyUnflaggedIndexes[1] = self.flat[i]["mines"] - nearbyFlaggedCellsCount
-							allLinkedGroups.append(nearbyUnflaggedIndexes)
-
-		shiftUpdates = True
-
-		# adding & shifting linked groups
-		while (shiftUpdates):
-			shiftUpdates = False
-
-			for i in importantIndexes:
-				linkedGroupsSum = [[], 0]
-				nearbyClosedIndexes = []
-				nearbyFlaggedCellsCount = 0
+		if (NUMPY_BACKEND):
+			# 3x3 neighborhood sums, minus the cell itself
+			isClosed = 1 - numpy.frombuffer(self.isOpen, numpy.uint8).reshape(self.rows, self.cols)
+			isFlag = isClosed & numpy.frombuffer(self.isFlag, numpy.uint8).reshape(self.rows, self.cols)
+			nearbyClosed, nearbyFlags = -isClosed, -isFlag
+			isClosed, isFlag = numpy.pad(isClosed, 1), numpy.pad(isFlag, 1)
 
-				for nearbyCell in self.getNearbyCells(*self.flat[i]["pos"]):
-					if (nearbyCell["isFlag"]):
-						nearbyFlaggedCellsCount += 1
-					elif (not nearbyCell["isOpen"]):
-						nearbyClosedIndexes.append(nearbyCell["index"])
-
-				for linkedGroup in allLinkedGroups:
-					if (isSublist(nearbyClosedIndexes, linkedGroup[0]) and len(nearbyClosedIndexes) != len(linkedGroup[0])):
-						shiftLinkedGroup = [
-							subtractLists(nearbyClosedIndexes, linkedGroup[0]), # shifting
-							self.flat[i]["mines"] - linkedGroup[1] - nearbyFlaggedCellsCount
-						]
-
-						if (len(shiftLinkedGroup[0]) > 0 and shiftLinkedGroup[1] > 0 and not shiftLinkedGroup in allLinkedGroups):
-							allLinkedGroups.append(shiftLinkedGroup)
-							shiftUpdates = True
-
-						if (not hasDuplicates(linkedGroupsSum[0], linkedGroup[0])): # adding
-							linkedGroupsSum[1] += linkedGroup[1]
-							linkedGroupsSum[0].extend(linkedGroup[0])
-
-				if (len(linkedGroupsSum[0]) > 0 and not linkedGroupsSum in allLinkedGroups):
-					allLinkedGroups.append(linkedGroupsSum)
-					shiftUpdates = True
-
-		# open cells in linked groups
-		for i in importantIndexes:
-			nearbyIndexes = [cell["index"] for cell in self.getNearbyCells(*self.flat[i]["pos"])]
-
-			for linkedGroup in allLinkedGroups:
-				if (hasDuplicates(linkedGroup[0], nearbyIndexes)):
-					nearbyFlaggedCellsCount = 0
-					nearbyUnkownIndexes = []
-
-					for index in nearbyIndexes:
-						if (self.flat[index]["isFlag"]):
-							nearbyFlaggedCellsCount += 1
-						elif (not self.flat[index]["isOpen"] and not index in linkedGroup[0]):
-							nearbyUnkownIndexes.append(index)
-
-					if (len(nearbyUnkownIndexes) > 0):
-						linkedGroupUncontainedCellsCount = len(subtractLists(linkedGroup[0], nearbyIndexes))
-
-						# all unknown cells are mines -> flag them
-						if (self.flat[i]["mines"] == nearbyFlaggedCellsCount + linkedGroup[1] + len(nearbyUnkownIndexes)):
-							for index in nearbyUnkownIndexes:
-								return self.flat[index]
-						# all unknown cells are clear > open them
-						elif (self.flat[i]["mines"] == nearbyFlaggedCellsCount + linkedGroup[1] - linkedGroupUncontainedCellsCount):
-							for index in nearbyUnkownIndexes:
-								if (not self.flat[index]["isFlag"]):
-									return self.flat[index]
-
-		# 3rd try: open cells using remaining flags count
-		flagsCount = 0
-		minesCount = 0
-
-		for cell in self.flat:
-			if (cell["isFlag"]): flagsCount += 1
-			if (cell["isMine"]): minesCount += 1
-
-		if (flagsCount == minesCount):
-			for cell in self.flat:
-				if (not cell["isOpen"] and not cell["isFlag"]):
-					return cell
+			for i in range(3):
+				for j in range(3):
+					nearbyClosed += isClosed[i:i+self.rows, j:j+self.cols]
+					nearbyFlags += isFlag[i:i+self.rows, j:j+self.cols]
+
+			self.nearbyClosed = bytearray(nearbyClosed.tobytes())
+			self.nearbyFlags = bytearray(nearbyFlags.tobytes())
+		else:
+			self.nearbyClosed = bytearray(self.rows*self.cols)
+			self.nearbyFlags = bytearray(self.rows*self.cols)
+
+			for index in range(self.rows*self.cols):
+				if (not self.isOpen[index]):
+					for nearbyIndex in neighbors[offsets[index]:offsets[index+1]]:
+						self.nearbyClosed[nearbyIndex] += 1
+						if (self.isFlag[index]): self.nearbyFlags[nearbyIndex] += 1
+
+		self.actionable = bytearray(self.rows*self.cols)
+		for index in range(self.rows*self.cols):
+			self.refreshActionable(index)
+
+	def updateActionable(self, indexes, nearbyCounts, change):
+		# a move only changes the actions of the changed cells & their neighbors
+		offsets, neighbors = self.adjacency
+		changedIndexes = set(indexes)
+
+		for index in indexes:
+			for nearbyIndex in neighbors[offsets[index]:offsets[index+1]]:
+				nearbyCounts[nearbyIndex] += change
+				changedIndexes.add(nearbyIndex)
+
+		for index in changedIndexes:
+			self.refreshActionable(index)
+
+	def refreshActionable(self, index):
+		if (not self.isOpen[index]):
+			self.actionable[index] = ACTION_OPEN
+		elif (self.nearbyMines[index] == 0):
+			self.actionable[index] = 0
 		else:
-			for linkedGroup in allLinkedGroups:
-				linkedGroup[0].sort()
-			allLinkedGroups.sort()
+			self.actionable[index] = (
+				(ACTION_CHORD if self.nearbyMines[index] == self.nearbyFlags[index] else 0) |
+				(ACTION_FLAG if self.nearbyMines[index] == self.nearbyClosed[index] else 0)
+			)
 
-			linkedGroupsSum = [[], 0]
+	def moveMine(self, fromIndex, toIndex):
+		offsets, neighbors = self.adjacency
 
-			for linkedGroup in allLinkedGroups:
-				if (not hasDuplicates(linkedGroupsSum[0], linkedGroup[0])):
-					linkedGroupsSum[1] += linkedGroup[1]
-					linkedGroupsSum[0].extend(linkedGroup[0])
+		self.isMine[fromIndex] = 0
+		self.nearbyMines[fromIndex] -= 1
+		for nearbyIndex in neighbors[offsets[fromIndex]:offsets[fromIndex+1]]:
+			self.nearbyMines[nearbyIndex] -= 1
 
-			allLinkedGroups.append(linkedGroupsSum)
+		self.isMine[toIndex] = 1
+		self.nearbyMines[toIndex] += 1
+		for nearbyIndex in neighbors[offsets[toIndex]:offsets[toIndex+1]]:
+			self.nearbyMines[nearbyIndex] += 1
 
-			for linkedGroup in allLinkedGroups:
-				if linkedGroup[1] == minesCount - flagsCount:
-					for cell in self.flat:
-						if (not cell["isOpen"] and not cell["isFlag"] and not cell["index"] in linkedGroup[0]):
-							return cell
+		self.moves.append((fromIndex, toIndex))
+		self.hintSolver = None
+		self.actionable = None
 
-		return None
+		if (self.isOpen[fromIndex] or self.isOpen[toIndex]):
+			self.countState()
 
 	def moveMineToCorner(self, row, col):
-		if (self.field[row][col]["isMine"]):
-			for i in range(self.rows):
-				for j in range(self.cols):
-					if (not self.field[i][j]["isMine"]):
-						self.field[i][j]["isMine"] = True
-						self.field[row][col]["isMine"] = False
+		index = self.positionToIndex(row, col)
+
+		if (self.isMine[index]):
+			for cornerIndex in range(self.rows*self.cols):
+				if (not self.isMine[cornerIndex]):
+					self.moveMine(index, cornerIndex)
+					return Cell(self, cornerIndex)
 
-						for cell in self.getNearbyCells(i, j, True):
-							cell["mines"] += 1
+	def repairFrom(self, row, col, maxMoves=None, stats=None):
+		# instead of throwing away a board the solver gets stuck on, move the stuck frontier mines away from it
+		offsets, neighbors = self.adjacency
+		rng = random.Random(f"{self.seed}/{len(self.moves)}")
+		maxMoves = self.mines if maxMoves is None else maxMoves
+		moves = 0
 
-						for cell in self.getNearbyCells(row, col, True):
-							cell["mines"] -= 1
+		while (True):
+			if (self.isSolvableFrom(row, col, restore=False, firstMoveCheck=False, stats=stats)):
+				self.restore()
+				return True
 
-						return self.field[i][j]
+			stuckMines = []
+			freeIndexes = []
+
+			for index in range(self.rows*self.cols):
+				if (not self.isOpen[index] and not self.isFlag[index]):
+					isFrontier = any(self.isOpen[nearbyIndex] for nearbyIndex in neighbors[offsets[index]:offsets[index+1]])
+
+					if (isFrontier and self.isMine[index]):
+						stuckMines.append(index)
+					elif (not isFrontier and not self.isMine[index]):
+						freeIndexes.append(index)
+
+			self.restore()
+
+			# the start zone has to stay opened, so mines only move away from opened cells
+			if (moves >= maxMoves or len(stuckMines) == 0 or len(freeIndexes) == 0):
+				return False
+
+			self.moveMine(rng.choice(stuckMines), rng.choice(freeIndexes))
+			moves += 1
 
 
 
@@ -483,86 +530,88 @@ class Minefield:
 
 
 
-	def getNearbyCells(self, row, col, includeSelf=False):
-		nearbyCells = []
-
-		isNotFirstCol = col > 0
-		isNotLastCol = col < self.cols-1
+	@property
+	def adjacency(self):
+		return getAdjacency(self.rows, self.cols)
 
-		if (row > 0):
-			if (isNotFirstCol): nearbyCells.append(self.field[row-1][col-1])
-			nearbyCells.append(self.field[row-1][col])
-			if (isNotLastCol): nearbyCells.append(self.field[row-1][col+1])
+	def getNearbyIndexes(self, index, includeSelf=False):
+		offsets, neighbors = self.adjacency
+		nearbyIndexes = neighbors[offsets[index]:offsets[index+1]]
 
-		if (isNotFirstCol): nearbyCells.append(self.field[row][col-1])
-		if (includeSelf): nearbyCells.append(self.field[row][col])
-		if (isNotLastCol): nearbyCells.append(self.field[row][col+1])
+		if (includeSelf): nearbyIndexes.append(index)
 
-		if (row < self.rows-1):
-			if (isNotFirstCol): nearbyCells.append(self.field[row+1][col-1])
-			nearbyCells.append(self.field[row+1][col])
-			if (isNotLastCol): nearbyCells.append(self.field[row+1][col+1])
+		return nearbyIndexes
 
-		return nearbyCells
+	def getNearbyCells(self, row, col, includeSelf=False):
+		return [Cell(self, index) for index in self.getNearbyIndexes(self.positionToIndex(row, col), includeSelf)]
+
+	def getEmptyZoneIndexes(self, indexes, includeFlagged=False):
+		offsets, neighbors = self.adjacency
+		visited = set(indexes)
+		zone = list(visited)
+
+		for zoneIndex in zone:
+			if (self.nearbyMines[zoneIndex] == 0):
+				for nearbyIndex in neighbors[offsets[zoneIndex]:offsets[zoneIndex+1]]:
+					if (nearbyIndex not in visited and (includeFlagged or not self.isFlag[nearbyIndex])):
+						visited.add(nearbyIndex)
+						zone.append(nearbyIndex)
+
+		return zone
+
+	def openEmptyZones(self, indexes):
+		# open the given cells and flood fill from the empty ones, the open bitmap doubles as the visited set
+		offsets, neighbors = self.adjacency
+		isOpen, isFlag, nearbyMines = self.isOpen, self.isFlag, self.nearbyMines
+		explodedCount = self.explodedCount
+		openedIndexes = []
+
+		for index in indexes:
+			if (not isOpen[index]):
+				isOpen[index] = 1
+				openedIndexes.append(index)
+				if (self.isMine[index]): self.explodedCount += 1
+
+		for openedIndex in openedIndexes:
+			if (nearbyMines[openedIndex] == 0):
+				for nearbyIndex in neighbors[offsets[openedIndex]:offsets[openedIndex+1]]:
+					if (not isOpen[nearbyIndex] and not isFlag[nearbyIndex]):
+						isOpen[nearbyIndex] = 1
+						openedIndexes.append(nearbyIndex)
+
+		# only the seeds can be mines, since every cell next to an empty one is safe
+		self.openCount += len(openedIndexes)
+		self.closedSafeCount -= len(openedIndexes) - (self.explodedCount - explodedCount)
+
+		if (self.actionable is not None):
+			if (any(isFlag[index] for index in openedIndexes)): self.actionable = None
+			else: self.updateActionable(openedIndexes, self.nearbyClosed, -1)
+		self.updateHints(openedIndexes)
+
+		return openedIndexes
 
 	def getEmptyZone(self, row, col, includeFlagged=False):
-		visited = [(row, col)]
-
-		for cell in visited:
-			if (self.field[cell[0]][cell[1]]["mines"] == 0):
-				for nearbyCell in self.getNearbyCells(*cell):
-					if (nearbyCell["pos"] not in visited):
-						if (includeFlagged or not nearbyCell["isFlag"]):
-							visited.append((nearbyCell["row"], nearbyCell["col"]))
-
-		return [self.field[cell[0]][cell[1]] for cell in visited]
+		return [Cell(self, index) for index in self.getEmptyZoneIndexes([self.positionToIndex(row, col)], includeFlagged)]
 
 	def cell(self, row, col):
-		return self.field[row][col]
+		return Cell(self, self.positionToIndex(row, col))
 
 
 
 	def isNew(self):
-		for row in self.field:
-			for cell in row:
-				if (cell["isOpen"]):
-					return False
-		return True
+		return self.openCount == 0
 
 	def isPlaying(self):
-		foundOpen = False
-		foundClosedEmpty = False
-
-		for row in self.field:
-			for cell in row:
-				if (cell["isOpen"]):
-					if (cell["isMine"]): return False
-					foundOpen = True
-				elif (not cell["isOpen"] and not cell["isMine"]): foundClosedEmpty = True
-
-		return foundOpen and foundClosedEmpty
+		return self.openCount > 0 and self.explodedCount == 0 and self.closedSafeCount > 0
 
 	def isOver(self):
-		foundClosedEmpty = False
-
-		for row in self.field:
-			for cell in row:
-				if (not cell["isOpen"] and not cell["isMine"]): foundClosedEmpty = True
-				elif (cell["isOpen"] and cell["isMine"]): return True
-
-		return not foundClosedEmpty
+		return self.explodedCount > 0 or self.closedSafeCount == 0
 
 	def isCleared(self):
-		for row in self.field:
-			for cell in row:
-				if (cell["isOpen"] == cell["isMine"]): return False
-		return True
+		return self.explodedCount == 0 and self.closedSafeCount == 0
 
 	def isLost(self):
-		for row in self.field:
-			for cell in row:
-				if (cell["isOpen"] and cell["isMine"]): return True
-		return False
+		return self.explodedCount > 0
 
 
 
@@ -599,28 +648,29 @@ class Minefield:
 
 		text = ""
 
-		for row in self.field:
-			if (color): text += getCycleColor(ROW_COLORS, row[0]["row"])
+		for row in range(self.rows):
+			if (color): text += getCycleColor(ROW_COLORS, row)
 
-			for cell in row:
+			for col in range(self.cols):
+				index = self.positionToIndex(row, col)
 				char = ""
 
-				if (not cell["isOpen"] and not uncover):
-					if (cell["isFlag"]): char += FLAG
+				if (not self.isOpen[index] and not uncover):
+					if (self.isFlag[index]): char += FLAG
 					else: char += CLOSED
-				elif (cell["isMine"]): char += MINE
-				elif (cell["mines"] == 0): char += EMPTY
-				else: char += str(cell["mines"])
+				elif (self.isMine[index]): char += MINE
+				elif (self.nearbyMines[index] == 0): char += EMPTY
+				else: char += str(self.nearbyMines[index])
 
-				if (color): text += getCycleColor(ROW_COLORS, row[0]["row"]) + getCycleColor(COL_COLORS, cell["col"])
+				if (color): text += getCycleColor(ROW_COLORS, row) + getCycleColor(COL_COLORS, col)
 
-				if (highlight and cell["pos"] in highlight):
+				if (highlight and (row, col) in highlight):
 					text += COLORS["HIGHLIGHT"] + char + COLORS["END"]
-					if (color): text += getCycleColor(ROW_COLORS, row[0]["row"]) + getCycleColor(COL_COLORS, cell["col"])
+					if (color): text += getCycleColor(ROW_COLORS, row) + getCycleColor(COL_COLORS, col)
 				else:
 					text += char
 
-				if (cell["col"] != self.cols-1): text += " "
+				if (col != self.cols-1): text += " "
 
 				if (color): text += COLORS["END"]
 			text += "\n"
@@ -632,59 +682,312 @@ class Minefield:
 
 	@property
 	def flags(self):
-		flagCount = 0
-		for row in self.field:
-			for cell in row:
-				if (cell["isFlag"]): flagCount += 1
-		return flagCount
+		return self.flagCount
+
 
 
+	def save(self, compress=True):
+		# header: magic, version, flags, size; payload: seed, lazy start, moves, then the mine, open & flag bitmaps
+		seedKind, seedLength, seedData = packSeed(self.seed)
 
-	def save(self):
-		openCells = []
-		flagCells = []
+		payload = b"".join([
+			struct.pack("<BII", seedKind, seedLength, len(seedData)), seedData,
+			struct.pack("<Bi", self.safeZone, -1 if self.start is None else self.start),
+			struct.pack(f"<I{len(self.moves)*2}I", len(self.moves), *(index for move in self.moves for index in move)),
+			packBits(self.isMine), packBits(self.isOpen), packBits(self.isFlag),
+		])
 
-		for cell in self.flat:
-			if (cell["isOpen"]): openCells.append(cell["index"])
-			if (cell["isFlag"]): flagCells.append(cell["index"])
+		flags = self.lazy << 1
+		if (compress):
+			compressed = zlib.compress(payload)
+			if (len(compressed) < len(payload)):
+				payload = compressed
+				flags |= 1
 
-		return json.dumps({
-			"rows": self.rows,
-			"cols": self.cols,
-			"mines": self.mines,
-			"open": openCells,
-			"flags": flagCells,
-			"seed": self.seed,
-		}, separators=(",", ":"))
+		return struct.pack("<4sBBIII", SAVE_MAGIC, SAVE_VERSION, flags, self.rows, self.cols, self.mines) + payload
 
 	@staticmethod
 	def load(data):
+		if (isinstance(data, (bytes, bytearray, memoryview)) and bytes(data[:4]) == SAVE_MAGIC):
+			return Minefield.loadBinary(memoryview(data))
+
 		load = json.loads(data)
 
-		minefield = Minefield(load["rows"], load["cols"], load["mines"], load["seed"])
+		minefield = Minefield(load["rows"], load["cols"], load["mines"], load["seed"], load.get("moves"), load.get("lazy", False), load.get("safeZone", 1), load.get("start"))
 
 		for i in load["open"]:
-			minefield.flat[i]["isOpen"] = True
+			minefield.setOpen(i)
 
 		for i in load["flags"]:
-			minefield.flat[i]["isFlag"] = True
+			minefield.setFlag(i)
+
+		return minefield
+
+	@staticmethod
+	def loadBinary(data):
+		magic, version, flags, rows, cols, mines = struct.unpack_from("<4sBBIII", data)
+		if (version > SAVE_VERSION):
+			raise ValueError(f"unsupported save version {version}")
+
+		payload = memoryview(zlib.decompress(data[18:])) if flags & 1 else data[18:]
+		offset = 0
+
+		seedKind, seedLength, seedSize = struct.unpack_from("<BII", payload, offset)
+		offset += 9
+		seed = unpackSeed(seedKind, seedLength, payload[offset:offset+seedSize])
+		offset += seedSize
+
+		safeZone, start = struct.unpack_from("<Bi", payload, offset)
+		offset += 5
+
+		movesCount, = struct.unpack_from("<I", payload, offset)
+		moveIndexes = struct.unpack_from(f"<{movesCount*2}I", payload, offset+4)
+		offset += 4 + movesCount*8
+
+		# the mines are stored, so an empty lazy board is filled instead of shuffling the seed again
+		minefield = Minefield(rows, cols, mines, seed, lazy=True, safeZone=safeZone)
+		minefield.lazy = bool(flags & 2)
+		minefield.start = None if start == -1 else start
+		minefield.moves = list(zip(moveIndexes[0::2], moveIndexes[1::2]))
+
+		bitmapSize = (rows*cols + 7)//8
+		minefield.isMine[:] = unpackBits(payload[offset:offset+bitmapSize], rows*cols)
+		minefield.isOpen[:] = unpackBits(payload[offset+bitmapSize:offset+bitmapSize*2], rows*cols)
+		minefield.isFlag[:] = unpackBits(payload[offset+bitmapSize*2:offset+bitmapSize*3], rows*cols)
+
+		minefield.recountMines()
+		minefield.countState()
 
 		return minefield
 
 
 
-def subtractLists(list1, list2):
-	return [item for item in list1 if item not in list2]
+class Cell:
+	__slots__ = ("minefield", "index")
+
+	def __init__(self, minefield, index):
+		self.minefield = minefield
+		self.index = index
+
+	def __getitem__(self, key):
+		match key:
+			case "mines": return self.minefield.nearbyMines[self.index]
+			case "isMine": return self.minefield.isMine[self.index] == 1
+			case "isOpen": return self.minefield.isOpen[self.index] == 1
+			case "isFlag": return self.minefield.isFlag[self.index] == 1
+			case "row": return self.index // self.minefield.cols
+			case "col": return self.index % self.minefield.cols
+			case "pos": return self.minefield.indexToPosition(self.index)
+			case "index": return self.index
+		raise KeyError(key)
+
+	def __setitem__(self, key, value):
+		match key:
+			case "mines":
+				self.minefield.nearbyMines[self.index] = value
+				self.minefield.hintSolver = None
+				self.minefield.actionable = None
+			case "isMine":
+				self.minefield.isMine[self.index] = bool(value)
+				self.minefield.countState()
+			case "isOpen": self.minefield.setOpen(self.index, bool(value))
+			case "isFlag": self.minefield.setFlag(self.index, bool(value))
+			case _: raise KeyError(key)
+
+	def __eq__(self, other):
+		return isinstance(other, Cell) and self.minefield is other.minefield and self.index == other.index
+
+	def __hash__(self):
+		return hash((id(self.minefield), self.index))
+
+	def __repr__(self):
+		return f"Cell({self.minefield.indexToPosition(self.index)})"
+
+class CellList:
+	__slots__ = ("minefield", "start", "stop")
+
+	def __init__(self, minefield, start, stop):
+		self.minefield = minefield
+		self.start = start
+		self.stop = stop
+
+	def __len__(self):
+		return self.stop - self.start
+
+	def __getitem__(self, i):
+		if (isinstance(i, slice)):
+			return [Cell(self.minefield, self.start + j) for j in range(*i.indices(len(self)))]
+		if (i < 0): i += len(self)
+		if (not 0 <= i < len(self)): raise IndexError(i)
+		return Cell(self.minefield, self.start + i)
+
+	def __iter__(self):
+		for index in range(self.start, self.stop):
+			yield Cell(self.minefield, index)
+
+class Field:
+	__slots__ = ("minefield",)
+
+	def __init__(self, minefield):
+		self.minefield = minefield
+
+	def __len__(self):
+		return self.minefield.rows
+
+	def __getitem__(self, row):
+		if (isinstance(row, slice)):
+			return [self[i] for i in range(*row.indices(len(self)))]
+		if (row < 0): row += len(self)
+		if (not 0 <= row < len(self)): raise IndexError(row)
+		return CellList(self.minefield, row*self.minefield.cols, (row+1)*self.minefield.cols)
+
+	def __iter__(self):
+		for row in range(self.minefield.rows):
+			yield self[row]
+
+
+
+@functools.lru_cache(maxsize=8)
+def getAdjacency(rows, cols):
+	# CSR table: the neighbors of cell i are indexes[offsets[i]:offsets[i+1]]
+	if (NUMPY_BACKEND):
+		cellRows, cellCols = numpy.divmod(numpy.arange(rows*cols, dtype=numpy.intc), cols)
+		nearbyIndexes = []
+		isInside = []
+
+		for rowShift in (-1, 0, 1):
+			for colShift in (-1, 0, 1):
+				if (rowShift != 0 or colShift != 0):
+					nearbyRows, nearbyCols = cellRows+rowShift, cellCols+colShift
+					nearbyIndexes.append(nearbyRows*cols+nearbyCols)
+					isInside.append((nearbyRows >= 0) & (nearbyRows < rows) & (nearbyCols >= 0) & (nearbyCols < cols))
+
+		nearbyIndexes = numpy.stack(nearbyIndexes, axis=1)
+		isInside = numpy.stack(isInside, axis=1)
+
+		offsets = numpy.zeros(rows*cols+1, numpy.intc)
+		numpy.cumsum(isInside.sum(axis=1), out=offsets[1:])
+
+		return array("i", offsets.tobytes()), array("i", nearbyIndexes[isInside].tobytes())
+
+	offsets = array("i", [0])
+	indexes = array("i")
+
+	for row in range(rows):
+		nearbyRows = [nearbyRow for nearbyRow in (row-1, row, row+1) if 0 <= nearbyRow < rows]
+
+		for col in range(cols):
+			nearbyCols = [nearbyCol for nearbyCol in (col-1, col, col+1) if 0 <= nearbyCol < cols]
+
+			indexes.extend(nearbyRow*cols+nearbyCol for nearbyRow in nearbyRows for nearbyCol in nearbyCols if nearbyRow != row or nearbyCol != col)
+			offsets.append(len(indexes))
+
+	return offsets, indexes
+
+def packBits(bits):
+	# one bit per cell, the first cell in the highest bit
+	if (len(bits) == 0):
+		return b""
+
+	packed = int(bytes(bits).translate(bytes.maketrans(b"\x00\x01", b"01")), 2) << (-len(bits) % 8)
+	return packed.to_bytes((len(bits) + 7)//8, "big")
+
+def unpackBits(data, count):
+	if (count == 0):
+		return bytearray()
+
+	bits = format(int.from_bytes(data, "big") >> (-count % 8), f"0{count}b")
+	return bytearray(bits.encode().translate(bytes.maketrans(b"01", b"\x00\x01")))
+
+def packSeed(seed):
+	if (isinstance(seed, Seed64)):
+		return 2, 8, struct.pack("<Q", seed)
+
+	# plain int seeds keep the legacy shuffle, so they are stored apart from the 64-bit ones
+	if (isinstance(seed, int)):
+		encoded = str(seed).encode()
+		return 3, len(encoded), encoded
+
+	# seeds made of the generated characters are packed 6 bits each
+	if (all(char in SEED_CHARS for char in seed)):
+		return 1, len(seed), base64.b64decode(seed + "A"*(-len(seed) % 4))
+
+	encoded = seed.encode()
+	return 0, len(encoded), encoded
+
+def unpackSeed(kind, length, data):
+	if (kind == 3):
+		return int(bytes(data).decode())
+	if (kind == 2):
+		return Seed64(struct.unpack("<Q", data)[0])
+	if (kind == 1):
+		return base64.b64encode(data).decode()[:length]
+
+	return bytes(data).decode()
+
+def generateSeed(length=None):
+	# 64-bit seeds by default, strings of the given length like older versions
+	if (length is None):
+		return Seed64(int.from_bytes(os.urandom(8), "little"))
+
+	return "".join(random.choice(SEED_CHARS) for _ in range(length))
+
+
+
+class Seed64(int):
+	# seeds whose boards are drawn with SplitMix64, plain ints keep the legacy shuffle
+	def __new__(cls, value):
+		return super().__new__(cls, value & SEED_MASK)
+
+	def __repr__(self):
+		return f"Seed64({int(self)})"
+
+	# printed & formatted as the plain number, so it can be copied
+	__str__ = int.__repr__
+
+
+
+class SplitMix64:
+	# small explicit PRNG, the same numbers on every platform & python version
+	def __init__(self, seed):
+		self.state = seed & SEED_MASK
+
+	def next(self):
+		self.state = (self.state + 0x9E3779B97F4A7C15) & SEED_MASK
+		value = self.state
+		value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & SEED_MASK
+		value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & SEED_MASK
+		return value ^ (value >> 31)
+
+	def randbelow(self, n):
+		# reject the uneven tail, so every value is equally likely
+		limit = (1 << 64) - (1 << 64) % n
+		while True:
+			value = self.next()
+			if (value < limit):
+				return value % n
+
+	def randbelowMany(self, first, last):
+		# randbelow(n) for every n from first to last, the numbers drawn at once with numpy
+		if (NUMPY_BACKEND and last >= first):
+			bounds = numpy.arange(first, last+1, dtype=numpy.uint64)
+			values = numpy.uint64(self.state) + numpy.arange(1, len(bounds)+1, dtype=numpy.uint64)*numpy.uint64(0x9E3779B97F4A7C15)
+			values = (values ^ (values >> numpy.uint64(30)))*numpy.uint64(0xBF58476D1CE4E5B9)
+			values = (values ^ (values >> numpy.uint64(27)))*numpy.uint64(0x94D049BB133111EB)
+			values ^= values >> numpy.uint64(31)
+
+			# 2^64 % n, a value is rejected at or above 2^64 minus it; so rare that the loop below redraws everything
+			tails = (numpy.uint64(0) - bounds) % bounds
+			if (not numpy.any((tails != 0) & (values >= numpy.uint64(0) - tails))):
+				self.state = (self.state + len(bounds)*0x9E3779B97F4A7C15) & SEED_MASK
+				return (values % bounds).tolist()
 
-def hasDuplicates(list1, list2):
-	return any(item in list1 for item in list2)
+		return [self.randbelow(n) for n in range(first, last+1)]
 
-def isSublist(list, sublist):
-	return all(item in list for item in sublist)
+	def sample(self, population, k):
+		# Floyd's algorithm: k draws whatever the population size
+		selected = set()
+		for j, index in zip(range(len(population) - k, len(population)), self.randbelowMany(len(population) - k + 1, len(population))):
+			selected.add(j if index in selected else index)
 
-def generateSeed(length):
-	CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
-	seed = ""
-	for _ in range(length):
-		seed += random.choice(CHARS)
-	return seed
\ No newline at end of file
+		return [population[index] for index in sorted(selected)]
\ No newline at end of file
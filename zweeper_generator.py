@@ -0,0 +1,203 @@
+import os, time, queue, threading, multiprocessing
+
+from zweeper_engine import Minefield, generateSeed
+from zweeper_solver import SolverStats
+
+
+
+# in pool workers, the request the generator is searching for, batches of any other request stop between seeds
+searching = None
+
+def initWorker(value):
+	global searching
+	searching = value
+
+def isStale(request):
+	return searching is not None and searching.value != request
+
+def findSolvableSeed(rows, cols, mines, row, col, seeds, repair=False, collectStats=False, request=None):
+	stats = SolverStats() if collectStats else None
+
+	for checked, seed in enumerate(seeds, 1):
+		if (isStale(request)):
+			return checked-1, None, None, stats
+
+		minefield = Minefield(rows, cols, mines, seed)
+
+		if (repair and minefield.nearbyMines[minefield.positionToIndex(row, col)] == 0):
+			if (minefield.repairFrom(row, col, stats=stats)):
+				return checked, seed, minefield.moves, stats
+		elif (minefield.isSolvableFrom(row, col, firstMoveCheck=False, stats=stats)):
+			return checked, seed, minefield.moves, stats
+
+	return len(seeds), None, None, stats
+
+def findSolvableStartsSeed(rows, cols, mines, seeds, repair=False, collectStats=False, request=None):
+	# for when the first click is not known yet, every start cell the board can be solved from
+	for checked, seed in enumerate(seeds, 1):
+		if (isStale(request)):
+			return checked-1, None, None, None
+
+		minefield = Minefield(rows, cols, mines, seed)
+		starts = minefield.getSolvableStartIndexes()
+
+		# dense boards are almost never solvable as they are, they get repaired from their largest empty zone
+		if (len(starts) == 0 and repair):
+			start = getLargestZoneIndex(minefield)
+
+			if (start is not None and minefield.repairFrom(*minefield.indexToPosition(start))):
+				starts = minefield.getSolvableStartIndexes()
+
+		if (len(starts) > 0):
+			return checked, seed, (minefield.moves, set(starts)), None
+
+	return len(seeds), None, None, None
+
+def getLargestZoneIndex(minefield):
+	bestIndex, bestSize = None, 0
+	checked = bytearray(minefield.rows*minefield.cols)
+
+	for index in range(minefield.rows*minefield.cols):
+		if (minefield.nearbyMines[index] == 0 and not minefield.isMine[index] and not checked[index]):
+			zone = minefield.getEmptyZoneIndexes([index])
+			for zoneIndex in zone:
+				checked[zoneIndex] = 1
+
+			if (len(zone) > bestSize):
+				bestIndex, bestSize = index, len(zone)
+
+	return bestIndex
+
+
+
+class NoGuessGenerator:
+	def __init__(self, rows, cols, mines, processes=None, batchSize=4, repair=False, stats=None):
+		self.rows = rows
+		self.cols = cols
+		self.mines = mines
+		self.processes = processes or os.cpu_count() or 1
+		self.batchSize = batchSize
+		self.repair = repair
+		self.stats = stats
+
+		self.pool = None
+		self.lock = threading.Lock()
+		self.candidates = 0
+
+		# every call gets a request number before waiting for the lock, so a cancel sent before its search starts isn't lost
+		self.requestLock = threading.Lock()
+		self.requested = 0
+		self.cancelledUpTo = 0
+		self.searching = multiprocessing.Value("q", 0)
+
+	def newRequest(self):
+		with self.requestLock:
+			self.requested += 1
+			return self.requested
+
+	def isCancelled(self, request):
+		return request <= self.cancelledUpTo
+
+	def generate(self, row, col, timeout=None, progress=None):
+		request = self.newRequest()
+
+		with self.lock:
+			found = self.search(request, findSolvableSeed, (row, col), (self.repair,), timeout, progress)
+
+		if (found is not None):
+			seed, moves = found
+			return Minefield(self.rows, self.cols, self.mines, seed, moves)
+
+	def generateAnyStart(self, timeout=None, progress=None):
+		request = self.newRequest()
+
+		with self.lock:
+			found = self.search(request, findSolvableStartsSeed, (), (self.repair,), timeout, progress)
+
+		if (found is not None):
+			seed, (moves, starts) = found
+			return Minefield(self.rows, self.cols, self.mines, seed, moves), starts
+
+	def search(self, request, task, args, options, timeout, progress):
+		# the task gets the size, args, a batch of seeds, options, whether to collect stats & the request
+		self.candidates = 0
+		deadline = None if timeout is None else time.monotonic() + timeout
+
+		if (self.processes <= 1):
+			return self.searchInline(request, task, args, options, deadline, progress)
+
+		if (self.pool is None):
+			self.pool = multiprocessing.Pool(self.processes, initializer=initWorker, initargs=(self.searching,))
+
+		self.searching.value = request
+
+		try:
+			return self.searchPool(request, task, args, options, deadline, progress)
+		finally:
+			# the batches still queued stop at their next seed instead of running to the end
+			self.searching.value = 0
+
+	def searchPool(self, request, task, args, options, deadline, progress):
+		results = queue.Queue()
+		pendingTasks = 0
+
+		while (True):
+			# keep every worker busy, without queueing more seeds than needed
+			while (pendingTasks < self.processes*2):
+				seeds = [self.generateSeed() for _ in range(self.batchSize)]
+				self.pool.apply_async(task, (self.rows, self.cols, self.mines, *args, seeds, *options, self.stats is not None, request), callback=results.put, error_callback=results.put)
+				pendingTasks += 1
+
+			if (self.isCancelled(request) or (deadline is not None and time.monotonic() > deadline)):
+				self.terminate()
+				return None
+
+			try:
+				result = results.get(timeout=0.05)
+			except queue.Empty:
+				continue
+
+			pendingTasks -= 1
+
+			if (isinstance(result, BaseException)):
+				self.terminate()
+				raise result
+
+			checked, seed, found, stats = result
+			self.candidates += checked
+			if (stats is not None): self.stats.merge(stats)
+			if (progress): progress(self.candidates)
+
+			if (seed is not None):
+				return seed, found
+
+	def searchInline(self, request, task, args, options, deadline, progress):
+		while (not self.isCancelled(request) and (deadline is None or time.monotonic() <= deadline)):
+			checked, seed, found, stats = task(self.rows, self.cols, self.mines, *args, [self.generateSeed()], *options, self.stats is not None)
+			self.candidates += checked
+			if (stats is not None): self.stats.merge(stats)
+			if (progress): progress(self.candidates)
+
+			if (seed is not None):
+				return seed, found
+
+		return None
+
+	def generateSeed(self):
+		return generateSeed()
+
+	def cancel(self):
+		# stops the running search & the ones already asked for
+		with self.requestLock:
+			self.cancelledUpTo = self.requested
+
+	def terminate(self):
+		if (self.pool is not None):
+			self.pool.terminate()
+			self.pool = None
+
+	def close(self):
+		self.cancel()
+
+		with self.lock:
+			self.terminate()
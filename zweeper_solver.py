@@ -0,0 +1,639 @@
+import time
+from collections import deque
+from math import comb
+
+
+
+UNKNOWN = 0
+SAFE = 1
+MINE = 2
+
+PHASES = ("trivial", "linked", "global", "endgame")
+
+
+
+class SolverStats:
+	def __init__(self):
+		self.boards = 0
+		self.iterations = 0
+
+		# per phase: cells & linked groups checked, linked groups made new or already known, cells deduced, seconds spent
+		self.evaluated = dict.fromkeys(PHASES, 0)
+		self.created = dict.fromkeys(PHASES, 0)
+		self.duplicates = dict.fromkeys(PHASES, 0)
+		self.deductions = dict.fromkeys(PHASES, 0)
+		self.time = dict.fromkeys(PHASES, 0.0)
+
+		self.failures = {}
+		self.lastFailure = None
+
+		self.phase = "trivial"
+		self.phaseStart = None
+
+	def enter(self, phase):
+		now = time.perf_counter()
+		if (self.phaseStart is not None): self.time[self.phase] += now - self.phaseStart
+
+		self.phase = phase
+		self.phaseStart = now
+
+	def leave(self):
+		self.enter(self.phase)
+		self.phaseStart = None
+
+	def fail(self, reason, details=None):
+		self.failures[reason] = self.failures.get(reason, 0) + 1
+		self.lastFailure = reason if details is None else f"{reason}: {details}"
+
+	def merge(self, other):
+		self.boards += other.boards
+		self.iterations += other.iterations
+
+		for phase in PHASES:
+			self.evaluated[phase] += other.evaluated[phase]
+			self.created[phase] += other.created[phase]
+			self.duplicates[phase] += other.duplicates[phase]
+			self.deductions[phase] += other.deductions[phase]
+			self.time[phase] += other.time[phase]
+
+		for reason, count in other.failures.items():
+			self.failures[reason] = self.failures.get(reason, 0) + count
+		self.lastFailure = other.lastFailure or self.lastFailure
+
+	def toDict(self):
+		return {
+			"boards": self.boards,
+			"iterations": self.iterations,
+			"evaluated": self.evaluated,
+			"created": self.created,
+			"duplicates": self.duplicates,
+			"deductions": self.deductions,
+			"time": self.time,
+			"failures": self.failures,
+			"lastFailure": self.lastFailure,
+		}
+
+	def __repr__(self):
+		return f"SolverStats({self.toDict()})"
+
+
+
+class LinkedGroup:
+	__slots__ = ("cells", "mines")
+
+	def __init__(self, cells, mines):
+		self.cells = frozenset(cells)
+		self.mines = mines
+
+	def isValid(self):
+		return len(self.cells) > 0 and 0 <= self.mines <= len(self.cells)
+
+	def isSafe(self):
+		return self.mines == 0
+
+	def isMines(self):
+		return self.mines == len(self.cells)
+
+	def isLinkedTo(self, other):
+		return not self.cells.isdisjoint(other.cells)
+
+	def without(self, index, isMine=False):
+		return LinkedGroup(self.cells - {index}, self.mines - isMine)
+
+	# shifting: the cells of a group minus the cells of a group inside it
+	def __sub__(self, other):
+		return LinkedGroup(self.cells - other.cells, self.mines - other.mines)
+
+	def __lt__(self, other):
+		return self.cells < other.cells
+
+	def __len__(self):
+		return len(self.cells)
+
+	def __iter__(self):
+		return iter(self.cells)
+
+	def __contains__(self, index):
+		return index in self.cells
+
+	def __eq__(self, other):
+		return isinstance(other, LinkedGroup) and self.mines == other.mines and self.cells == other.cells
+
+	def __hash__(self):
+		return hash((self.cells, self.mines))
+
+	def __repr__(self):
+		return f"LinkedGroup({sorted(self.cells)}, {self.mines})"
+
+
+
+class Solver:
+	def __init__(self, minefield, stats=None):
+		self.minefield = minefield
+		self.stats = stats
+		self.offsets, self.neighbors = minefield.adjacency
+
+		self.known = bytearray(minefield.rows*minefield.cols)
+		self.knownMines = 0
+
+		# revealed cells, with the mines and unknown cells still around them
+		self.revealed = bytearray(minefield.rows*minefield.cols)
+		self.minesLeft = [0]*(minefield.rows*minefield.cols)
+		self.unknownLeft = [0]*(minefield.rows*minefield.cols)
+
+		# linked groups, and the linked groups holding each unknown cell
+		self.groups = set()
+		self.cellGroups = {}
+
+		# revealed cells to check on their own, and the ones still waiting for a linked group
+		self.trivialIndexes = deque()
+		self.pendingIndexes = []
+
+		# linked groups to check on their own, then against each other
+		self.trivialWorklist = deque()
+		self.worklist = deque()
+
+		# deductions not yet taken by the caller
+		self.safeIndexes = []
+		self.mineIndexes = []
+
+		# configurations counted per independent part of the frontier
+		self.componentCache = {}
+
+		openIndexes = []
+
+		for index in range(minefield.rows*minefield.cols):
+			if (minefield.isFlag[index]):
+				self.known[index] = MINE
+				self.knownMines += 1
+			elif (minefield.isOpen[index]):
+				self.known[index] = SAFE
+				openIndexes.append(index)
+
+		self.reveal(openIndexes)
+
+
+
+	def reveal(self, indexes):
+		for index in indexes:
+			if (self.known[index] == UNKNOWN):
+				self.setKnown(index, SAFE)
+
+		for index in indexes:
+			mines = self.minefield.nearbyMines[index]
+			unknown = 0
+
+			for nearbyIndex in self.neighbors[self.offsets[index]:self.offsets[index+1]]:
+				if (self.known[nearbyIndex] == UNKNOWN):
+					unknown += 1
+				elif (self.known[nearbyIndex] == MINE):
+					mines -= 1
+
+			self.revealed[index] = 1
+			self.minesLeft[index] = mines
+			self.unknownLeft[index] = unknown
+
+			if (unknown > 0):
+				if (mines == 0 or mines == unknown):
+					self.trivialIndexes.append(index)
+				else:
+					self.pendingIndexes.append(index)
+
+	def setKnown(self, index, state):
+		self.known[index] = state
+		if (state == MINE): self.knownMines += 1
+
+		for nearbyIndex in self.neighbors[self.offsets[index]:self.offsets[index+1]]:
+			if (self.revealed[nearbyIndex]):
+				self.unknownLeft[nearbyIndex] -= 1
+				if (state == MINE): self.minesLeft[nearbyIndex] -= 1
+
+				if (self.unknownLeft[nearbyIndex] > 0 and self.minesLeft[nearbyIndex] in (0, self.unknownLeft[nearbyIndex])):
+					self.trivialIndexes.append(nearbyIndex)
+
+		# every linked group holding the cell shrinks to the cells still unknown
+		if (index in self.cellGroups):
+			for group in list(self.cellGroups[index]):
+				self.removeGroup(group)
+				self.addGroup(group.without(index, state == MINE))
+
+			del self.cellGroups[index]
+
+	def markSafe(self, index):
+		if (self.known[index] == UNKNOWN):
+			self.setKnown(index, SAFE)
+			self.safeIndexes.append(index)
+			if (self.stats is not None): self.stats.deductions[self.stats.phase] += 1
+
+	def markMine(self, index):
+		if (self.known[index] == UNKNOWN):
+			self.setKnown(index, MINE)
+			self.mineIndexes.append(index)
+			if (self.stats is not None): self.stats.deductions[self.stats.phase] += 1
+
+
+
+	def addNearbyGroup(self, index):
+		cells = [nearbyIndex for nearbyIndex in self.neighbors[self.offsets[index]:self.offsets[index+1]] if self.known[nearbyIndex] == UNKNOWN]
+		self.addGroup(LinkedGroup(cells, self.minesLeft[index]))
+
+	def addGroup(self, group):
+		if (not group.isValid()):
+			return
+
+		if (group in self.groups):
+			if (self.stats is not None): self.stats.duplicates[self.stats.phase] += 1
+			return
+
+		if (self.stats is not None): self.stats.created[self.stats.phase] += 1
+
+		self.groups.add(group)
+		for index in group.cells:
+			self.cellGroups.setdefault(index, set()).add(group)
+
+		if (group.isSafe() or group.isMines()):
+			self.trivialWorklist.append(group)
+		else:
+			self.worklist.append(group)
+
+	def removeGroup(self, group):
+		self.groups.remove(group)
+
+		for index in group.cells:
+			self.cellGroups[index].discard(group)
+
+
+
+	def solve(self):
+		stats = self.stats
+
+		while (True):
+			# 1st try: all cells around a number are safe or all are mines
+			if (stats is not None):
+				stats.enter("trivial")
+				stats.evaluated["trivial"] += len(self.trivialIndexes) + len(self.trivialWorklist)
+
+			while (self.trivialIndexes):
+				index = self.trivialIndexes.popleft()
+
+				if (self.unknownLeft[index] > 0):
+					if (self.minesLeft[index] == 0):
+						for nearbyIndex in self.neighbors[self.offsets[index]:self.offsets[index+1]]: self.markSafe(nearbyIndex)
+					elif (self.minesLeft[index] == self.unknownLeft[index]):
+						for nearbyIndex in self.neighbors[self.offsets[index]:self.offsets[index+1]]: self.markMine(nearbyIndex)
+
+			while (self.trivialWorklist):
+				group = self.trivialWorklist.popleft()
+
+				if (group in self.groups):
+					if (group.isSafe()):
+						for index in group: self.markSafe(index)
+					else:
+						for index in group: self.markMine(index)
+
+			if (self.trivialIndexes):
+				continue
+
+			# 2nd try: compare linked groups, built only once the 1st try is stuck and checked one at a time
+			if (stats is not None): stats.enter("linked")
+
+			if (self.pendingIndexes):
+				for index in self.pendingIndexes:
+					if (self.unknownLeft[index] > 0):
+						self.addNearbyGroup(index)
+
+				self.pendingIndexes = []
+			elif (self.worklist):
+				group = self.worklist.popleft()
+
+				if (group in self.groups):
+					self.process(group)
+			elif (not self.trivialWorklist):
+				break
+
+		if (stats is not None): stats.leave()
+
+		return len(self.safeIndexes) > 0 or len(self.mineIndexes) > 0
+
+	def process(self, group):
+		linkedGroups = set()
+		for index in group:
+			linkedGroups.update(self.cellGroups[index])
+		linkedGroups.discard(group)
+
+		if (self.stats is not None): self.stats.evaluated["linked"] += len(linkedGroups)
+
+		for linkedGroup in linkedGroups:
+			if (group not in self.groups):
+				return
+			if (linkedGroup not in self.groups):
+				continue
+
+			if (group < linkedGroup):
+				self.addGroup(linkedGroup - group)
+			elif (linkedGroup < group):
+				self.addGroup(group - linkedGroup)
+			else:
+				self.compareOverlapping(group, linkedGroup)
+				if (group in self.groups and linkedGroup in self.groups):
+					self.compareOverlapping(linkedGroup, group)
+
+	def compareOverlapping(self, group, linkedGroup):
+		outsideCells = linkedGroup.cells - group.cells
+		ownCells = len(group.cells - linkedGroup.cells)
+
+		# mines the first group can put into the shared cells, at least and at most
+		leastShared = max(0, group.mines - ownCells)
+		mostShared = min(group.mines, len(group) - ownCells)
+
+		if (linkedGroup.mines - leastShared == 0):
+			for index in outsideCells: self.markSafe(index)
+		elif (linkedGroup.mines - mostShared == len(outsideCells)):
+			for index in outsideCells: self.markMine(index)
+
+	def solveGlobal(self, minesCount):
+		if (self.stats is None):
+			return self.solveGlobalCount(minesCount)
+
+		self.stats.enter("global")
+		try:
+			return self.solveGlobalCount(minesCount)
+		finally:
+			self.stats.leave()
+
+	def solveEndgame(self, minesCount, maxCells=64):
+		if (self.stats is None):
+			return self.solveEndgameCount(minesCount, maxCells)
+
+		self.stats.enter("endgame")
+		try:
+			return self.solveEndgameCount(minesCount, maxCells)
+		finally:
+			self.stats.leave()
+
+	def solveGlobalCount(self, minesCount):
+		# 3rd try: use the count of mines left on the whole board
+		minesLeft = minesCount - self.knownMines
+		unknownIndexes = [index for index in range(len(self.known)) if self.known[index] == UNKNOWN]
+
+		if (len(unknownIndexes) == 0):
+			return False
+
+		if (minesLeft == 0):
+			for index in unknownIndexes: self.markSafe(index)
+			return True
+
+		if (minesLeft == len(unknownIndexes)):
+			for index in unknownIndexes: self.markMine(index)
+			return True
+
+		linkedCells = set()
+		linkedMines = 0
+
+		if (self.stats is not None): self.stats.evaluated["global"] += len(self.groups) + 1
+
+		for group in sorted(self.groups, key=lambda group: sorted(group.cells)):
+			if (linkedCells.isdisjoint(group.cells)):
+				linkedCells.update(group.cells)
+				linkedMines += group.mines
+
+		for group in [LinkedGroup(linkedCells, linkedMines)] + list(self.groups):
+			if (group.mines == minesLeft):
+				for index in unknownIndexes:
+					if (index not in group):
+						self.markSafe(index)
+
+				if (len(self.safeIndexes) > 0):
+					return True
+
+		return False
+
+	def solveEndgameCount(self, minesCount, maxCells):
+		# 4th try: with few cells left, a cell is forced when it is safe or a mine in every arrangement
+		if (self.known.count(UNKNOWN) > maxCells):
+			return False
+
+		total, weights = self.countConfigurations(minesCount)
+		if (self.stats is not None): self.stats.evaluated["endgame"] += len(weights)
+
+		if (total == 0):
+			return False
+
+		for index, weight in weights.items():
+			if (weight == 0): self.markSafe(index)
+			elif (weight == total): self.markMine(index)
+
+		return len(self.safeIndexes) > 0 or len(self.mineIndexes) > 0
+
+	def takeDeductions(self):
+		safeIndexes, mineIndexes = self.safeIndexes, self.mineIndexes
+		self.safeIndexes, self.mineIndexes = [], []
+		return safeIndexes, mineIndexes
+
+
+
+	def countConfigurations(self, minesCount):
+		# weigh every arrangement of the mines left, counting each frontier part on its own
+		minesLeft = minesCount - self.knownMines
+		unknownIndexes = [index for index in range(len(self.known)) if self.known[index] == UNKNOWN]
+
+		constraints = set()
+		for index in range(len(self.known)):
+			if (self.revealed[index] and self.unknownLeft[index] > 0):
+				cells = frozenset(nearbyIndex for nearbyIndex in self.neighbors[self.offsets[index]:self.offsets[index+1]] if self.known[nearbyIndex] == UNKNOWN)
+				constraints.add((cells, self.minesLeft[index]))
+
+		if (minesLeft < 0):
+			return 0, {}
+
+		components = getComponents(constraints)
+		otherCount = len(unknownIndexes) - sum(len(cells) for cells, _ in components)
+
+		if (len(self.componentCache) > 256):
+			self.componentCache.clear()
+
+		counted = []
+		for cells, componentConstraints in components:
+			key = frozenset(componentConstraints)
+			if (key not in self.componentCache):
+				self.componentCache[key] = countComponent(cells, componentConstraints)
+			counted.append(self.componentCache[key])
+
+		if (any(result is None for result in counted)):
+			return 0, {}
+
+		# ways to put the mines left over outside the frontier, by mines used in the frontier
+		outsideWays = [comb(otherCount, minesLeft - mines) if 0 <= minesLeft - mines <= otherCount else 0 for mines in range(minesLeft+1)]
+
+		# mine counts of all the parts before and after each part
+		prefixes = [[1]]
+		for totalPoly, _, _ in counted:
+			prefixes.append(multiplyPolys(prefixes[-1], totalPoly, minesLeft))
+		suffixes = [[1]]
+		for totalPoly, _, _ in reversed(counted):
+			suffixes.append(multiplyPolys(suffixes[-1], totalPoly, minesLeft))
+		suffixes.reverse()
+
+		total = sum(count*outsideWays[mines] for mines, count in enumerate(prefixes[-1]))
+		weights = {}
+
+		for i, (totalPoly, cells, cellPolys) in enumerate(counted):
+			others = multiplyPolys(prefixes[i], suffixes[i+1], minesLeft)
+			# weight of the rest of the board, by mines used in this part
+			otherWays = [sum(count*outsideWays[mines+otherMines] for otherMines, count in enumerate(others) if mines+otherMines <= minesLeft) for mines in range(len(totalPoly))]
+
+			for cell, cellPoly in zip(cells, cellPolys):
+				weights[cell] = sum(count*otherWays[mines] for mines, count in enumerate(cellPoly))
+
+		if (otherCount > 0):
+			outsideWeight = sum(count*comb(otherCount-1, minesLeft-mines-1) for mines, count in enumerate(prefixes[-1]) if 0 <= minesLeft-mines-1 <= otherCount-1)
+
+			for index in unknownIndexes:
+				if (index not in weights):
+					weights[index] = outsideWeight
+
+		return total, weights
+
+	def getProbabilities(self, minesCount):
+		total, weights = self.countConfigurations(minesCount)
+
+		if (total == 0):
+			return {}
+
+		return {index: weight/total for index, weight in weights.items()}
+
+	def getSafestGuess(self, minesCount):
+		probabilities = self.getProbabilities(minesCount)
+
+		if (len(probabilities) == 0):
+			return None
+
+		return min(probabilities, key=lambda index: (probabilities[index], index))
+
+
+
+def getComponents(constraints):
+	# split the frontier into groups of cells linked by numbers
+	cellConstraints = {}
+	for constraint in constraints:
+		for cell in constraint[0]:
+			cellConstraints.setdefault(cell, []).append(constraint)
+
+	components = []
+	visited = set()
+
+	# start every walk from the cell with the fewest links, so the cells come out in a chain
+	for startCell in sorted(cellConstraints, key=lambda cell: (len(cellConstraints[cell]), cell)):
+		if (startCell in visited):
+			continue
+
+		cells = [startCell]
+		componentConstraints = set()
+		visited.add(startCell)
+
+		for cell in cells:
+			for constraint in cellConstraints[cell]:
+				if (constraint not in componentConstraints):
+					componentConstraints.add(constraint)
+					for linkedCell in sorted(constraint[0]):
+						if (linkedCell not in visited):
+							visited.add(linkedCell)
+							cells.append(linkedCell)
+
+		components.append((cells, list(componentConstraints)))
+
+	return components
+
+def countComponent(cells, constraints):
+	# count the mine arrangements of the cells, by number of mines, overall and with each cell being a mine:
+	# cells are decided in order, and a state holds the mines given so far to every number not yet complete
+	position = {cell: p for p, cell in enumerate(cells)}
+	touching = [[] for _ in cells]
+	active = [[] for _ in range(len(cells)+1)]
+
+	for j, (constraintCells, mines) in enumerate(constraints):
+		positions = sorted(position[cell] for cell in constraintCells)
+
+		for k, p in enumerate(positions):
+			touching[p].append((j, mines, len(positions)-k-1))
+		for b in range(positions[0]+1, positions[-1]+1):
+			active[b].append(j)
+
+	forward = [{(): [1]}]
+	transitions = []
+
+	for p in range(len(cells)):
+		layer = {}
+		layerTransitions = {}
+
+		for state, poly in forward[p].items():
+			values = dict(zip(active[p], state))
+			nextStates = []
+
+			for isMine in (0, 1):
+				for j, mines, cellsAfter in touching[p]:
+					assigned = values.get(j, 0) + isMine
+					if (assigned > mines or assigned + cellsAfter < mines):
+						nextStates.append(None)
+						break
+					values[j] = assigned
+				else:
+					nextState = tuple(values[j] for j in active[p+1])
+					nextStates.append(nextState)
+
+					nextPoly = layer.setdefault(nextState, [0]*(p+2))
+					for mines, count in enumerate(poly):
+						nextPoly[mines+isMine] += count
+
+				values = dict(zip(active[p], state))
+
+			layerTransitions[state] = nextStates
+
+		forward.append(layer)
+		transitions.append(layerTransitions)
+
+	if (() not in forward[-1] or not any(forward[-1][()])):
+		return None
+
+	backward = [None]*len(cells) + [{(): [1]}]
+
+	for p in range(len(cells)-1, -1, -1):
+		layer = {}
+
+		for state, nextStates in transitions[p].items():
+			poly = [0]*(len(cells)-p+1)
+
+			for isMine, nextState in enumerate(nextStates):
+				if (nextState is not None and nextState in backward[p+1]):
+					for mines, count in enumerate(backward[p+1][nextState]):
+						poly[mines+isMine] += count
+
+			layer[state] = poly
+
+		backward[p] = layer
+
+	cellPolys = []
+
+	for p in range(len(cells)):
+		cellPoly = [0]*(len(cells)+1)
+
+		for state, nextStates in transitions[p].items():
+			if (nextStates[1] is not None and nextStates[1] in backward[p+1]):
+				for before, count in enumerate(forward[p][state]):
+					if (count):
+						for after, nextCount in enumerate(backward[p+1][nextStates[1]]):
+							cellPoly[before+after+1] += count*nextCount
+
+		cellPolys.append(cellPoly)
+
+	return forward[-1][()], cells, cellPolys
+
+def multiplyPolys(poly1, poly2, maxDegree):
+	product = [0]*min(len(poly1)+len(poly2)-1, maxDegree+1)
+
+	for i, count1 in enumerate(poly1):
+		if (count1):
+			for j, count2 in enumerate(poly2[:len(product)-i]):
+				product[i+j] += count1*count2
+
+	return product
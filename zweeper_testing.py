@@ -42,9 +42,37 @@ import timeit, random
 #print(timeit.timeit(lambda: findSolvableFrom(2, 3), number=1))
 
 
-random.seed(57457475)
+def floodFill(rows=500, cols=500, mines=2500, tests=3):
+	floodTime = 0
+	chordTime = 0
+	opened = 0
+
+	for i in range(tests):
+		test = Minefield(rows, cols, mines, seed=f"flood{i}")
+		start = next(cell["pos"] for cell in test.flat if cell["mines"] == 0)
+
+		floodTime += timeit.timeit(lambda: test.open(*start), number=1)
+		opened += sum(test.isOpen)
+
+		# flag the mines around the closed frontier and chord every cell next to them
+		frontier = [cell for cell in test.flat if not cell["isOpen"] and not cell["isMine"]]
+		for cell in frontier:
+			for nearbyCell in test.getNearbyCells(*cell["pos"]):
+				if (nearbyCell["isMine"]): nearbyCell["isFlag"] = True
+		chords = [cell["pos"] for cell in test.flat if cell["isOpen"] and cell["mines"] != 0]
+
+		chordTime += timeit.timeit(lambda: [test.open(*pos, firstMoveCheck=False, nearbyOpening=True) for pos in chords], number=1)
+
+	print(f"{rows}x{cols}/{mines}: {opened/tests:.0f} cells flooded in {floodTime/tests*1000:.1f}ms, {len(chords)} chords in {chordTime/tests*1000:.1f}ms")
+
+# floodFill()
+
+# 500x500/2500:  247310 cells flooded in 252.4ms, 18853 chords in 48.3ms
+# 500x500/12500: 230598 cells flooded in 186.4ms, 73090 chords in 177.4ms
 
 def results(rows=11, cols=11, mines=24, start=(5, 5), tests=10000):
+	# a private generator, so the seeds don't depend on what the engine does with the global one
+	rng = random.Random(57457475)
 	isPlaying = 0
 	goodStarts = 0
 	isPlayingGoodStarts = 0
@@ -54,7 +82,7 @@ def results(rows=11, cols=11, mines=24, start=(5, 5), tests=10000):
 	firstCellMine = 0
 
 	for _ in range(tests):
-		test = Minefield(rows, cols, mines, seed=random.randint(0, 1000000))
+		test = Minefield(rows, cols, mines, seed=rng.randint(0, 1000000))
 		test.isSolvableFrom(*start, False)
 
 		if (test.cell(*start)["mines"] == 0):
@@ -84,10 +112,42 @@ def results(rows=11, cols=11, mines=24, start=(5, 5), tests=10000):
 # results()
 
 # Total tests: 10000
-# goodStarts: 1274
-# isPlaying (gs): 831
-# isCleared (gs): 443
+# goodStarts: 1643
+# isPlaying (gs): 964
+# isCleared (gs): 679
 # isLost: 0
 # 
-# % cleared: 4.43%
-# % cleared (/gs): 34.77%
\ No newline at end of file
+# % cleared: 6.79%
+# % cleared (/gs): 41.33%
+
+# boards of the verdict corpus the solver clears from the middle cell, by size and seed number (seeds are f"c{n}")
+SOLVABLE_CORPUS = {
+	(9, 9, 10, 400): [0, 2, 3, 6, 22, 29, 30, 32, 39, 46, 47, 48, 53, 56, 58, 59, 62, 64, 66, 71, 78, 79, 83, 85, 90, 91, 92, 93, 94, 95, 99, 103, 109, 118, 119, 131, 134, 135, 137, 140, 141, 149, 157, 160, 163, 165, 168, 169, 177, 180, 184, 185, 188, 192, 198, 200, 202, 203, 205, 211, 213, 214, 219, 226, 232, 235, 240, 242, 244, 247, 248, 252, 259, 260, 263, 270, 275, 277, 279, 284, 291, 293, 294, 295, 297, 311, 317, 321, 328, 331, 334, 340, 342, 343, 347, 352, 355, 360, 361, 364, 365, 368, 370, 377, 378, 380, 381, 385, 387, 389, 391, 392, 393, 394, 398, 399],
+	(16, 16, 40, 400): [0, 1, 11, 13, 16, 20, 23, 29, 37, 44, 45, 52, 56, 58, 59, 60, 67, 69, 74, 82, 103, 111, 120, 135, 137, 138, 153, 157, 159, 169, 172, 180, 193, 200, 201, 215, 226, 229, 230, 231, 236, 250, 251, 252, 253, 258, 259, 265, 273, 277, 278, 279, 292, 302, 306, 308, 326, 329, 336, 337, 349, 350, 352, 357, 361, 367, 374, 375, 378, 384, 396, 397],
+	(16, 30, 99, 150): [106, 142],
+	(30, 30, 150, 60): [6, 30, 31, 35, 39, 43, 46],
+}
+
+def verdicts(corpus=SOLVABLE_CORPUS):
+	# a solver change must not lose a board of the corpus, gained boards are checked by hand and then recorded
+	lost = []
+	gained = []
+
+	for (rows, cols, mines, count), solvable in corpus.items():
+		solvable = set(solvable)
+
+		for n in range(count):
+			test = Minefield(rows, cols, mines, seed=f"c{n}")
+			verdict = test.isSolvableFrom(rows//2, cols//2)
+
+			if (n in solvable and not verdict): lost.append((rows, cols, mines, n))
+			if (n not in solvable and verdict): gained.append((rows, cols, mines, n))
+
+	boards = sum(count for _, _, _, count in corpus)
+	print(f"{boards} boards, {sum(len(solvable) for solvable in corpus.values())} recorded solvable, lost: {lost}, gained: {gained}")
+
+	return lost, gained
+
+# verdicts()
+
+# 1010 boards, 197 recorded solvable, lost: [], gained: []